@@ -454,7 +454,7 @@ class BattleScriptInterpreter:
                 dmg = (((2 * level // 5 + 2) * 40 * atk) // max(1, df)) // 50 + 2
                 # Random 85-100%
                 r16 = rng.rand16(battle_state)
-                roll = 85 + (r16 % 16)
+                roll = 85 + (r16 & 15)
                 dmg = (dmg * roll) // 100
                 if dmg < 1:
                     dmg = 1
@@ -869,7 +869,7 @@ class BattleScriptInterpreter:
         # Apply random damage factor (85-100% of calculated damage)
         # Use the game's LCG for determinism
         rand16 = rng.rand16(battle_state)
-        roll = 85 + (rand16 % 16)  # 85..100 inclusive
+        roll = 85 + (rand16 & 15)  # 85..100 inclusive
         battle_state.battle_move_damage = (battle_state.battle_move_damage * roll) // 100
 
         # Ensure minimum damage of 1
@@ -1558,6 +1558,15 @@ class BattleScriptLibrary:
                     BattleScriptCommand.END,
                 ]
             ),
+            MoveEffect.BIDE: BattleScript(
+                [
+                    BattleScriptCommand.ATTACKCANCELER,
+                    BattleScriptCommand.PPREDUCE,
+                    # Start / store / release; the release applies 2x stored damage to the recorded attacker
+                    BattleScriptCommand.SETEFFECTPRIMARY,
+                    BattleScriptCommand.END,
+                ]
+            ),
             MoveEffect.SUPER_FANG: BattleScript(
                 [
                     BattleScriptCommand.ATTACKCANCELER,
@@ -3910,6 +3910,10 @@ BATTLE_MOVES = {
     ),
 }
 
+# Move data is static, so resolve the fallback entry and per-move types once at import
+_DEFAULT_MOVE = BATTLE_MOVES[Move.NONE]
+_MOVE_TYPES = {move: move_data.type for move, move_data in BATTLE_MOVES.items()}
+
 
 def get_move_data(move: Move) -> BattleMove:
     """
@@ -3921,7 +3925,7 @@ def get_move_data(move: Move) -> BattleMove:
     Returns:
         BattleMove object containing all move data, or default BattleMove if not found
     """
-    return BATTLE_MOVES.get(move, BATTLE_MOVES[Move.NONE])
+    return BATTLE_MOVES.get(move, _DEFAULT_MOVE)
 
 
 def get_move_effect(move: Move) -> MoveEffect:
@@ -3962,8 +3966,7 @@ def get_move_type(move: Move) -> Type:
     Returns:
         Type enum value for the move
     """
-    move_data = get_move_data(move)
-    return move_data.type
+    return _MOVE_TYPES.get(move, _DEFAULT_MOVE.type)
 
 
 def get_move_accuracy(move: Move) -> int:
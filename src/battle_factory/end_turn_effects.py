@@ -11,7 +11,7 @@ from src.battle_factory.schema.battle_state import BattleState
 from src.battle_factory.damage_calculator import DamageCalculator
 from src.battle_factory.data.moves import get_move_data
 from src.battle_factory.schema.battle_pokemon import BattlePokemon
-from src.battle_factory.move_effects.status_effects import apply_sleep
+from src.battle_factory.move_effects.status_effects import apply_sleep, is_uproar_active
 from src.battle_factory.utils import rng
 
 
@@ -341,12 +341,7 @@ class EndTurnEffectsProcessor:
                 if turns > 0:
                     battler.status2 = battler.status2.decrement_uproar()
                 # If any battler is in Uproar after decrement, wake all sleeping battlers
-                any_uproar = False
-                for b in self.battle_state.battlers:
-                    if b and b.status2.get_uproar_turns() > 0:
-                        any_uproar = True
-                        break
-                if any_uproar:
+                if is_uproar_active(self.battle_state):
                     for i, b in enumerate(self.battle_state.battlers):
                         if not b:
                             continue
@@ -363,7 +358,7 @@ class EndTurnEffectsProcessor:
                     if battler.status2.get_lock_confuse_turns() == 0:
                         # Apply confusion 2-5 turns
                         r = rng.rand16(self.battle_state)
-                        conf = 2 + (r % 4)
+                        conf = 2 + (r & 3)
                         battler.status2 = battler.status2.remove_confusion() | Status2.confusion_turn(conf)
                 self.battle_state.turn_effects_tracker = EndTurnBattlerEffect.DISABLE
                 effect_processed = True
@@ -385,6 +380,12 @@ class EndTurnEffectsProcessor:
                 # Bide timer decrement
                 if self.battle_state.disable_structs[battler_id].bideTimer > 0:
                     self.battle_state.disable_structs[battler_id].bideTimer -= 1
+                elif self.battle_state.disable_structs[battler_id].bideTimerStartValue > 0:
+                    # Release turn passed without a release (e.g. asleep or another move used):
+                    # drop the Bide so the next use starts a new one instead of releasing at once
+                    self.battle_state.disable_structs[battler_id].bideTimerStartValue = 0
+                    self.battle_state.bide_damage[battler_id] = 0
+                    self.battle_state.bide_target[battler_id] = 0
                 self.battle_state.turn_effects_tracker = EndTurnBattlerEffect.ENCORE
                 effect_processed = True
 
@@ -1,6 +1,9 @@
+from functools import partial
+from typing import Callable
+
 from src.battle_factory.enums import Ability, Move, MoveEffect, Type, Weather, Status2, SemiInvulnState
 from src.battle_factory.schema.battle_state import BattleState
-from src.battle_factory.data.moves import get_move_effect, get_move_data
+from src.battle_factory.data.moves import BATTLE_MOVES, get_move_effect
 from src.battle_factory.utils import rng
 from src.battle_factory.move_effects import (
     status_effects,
@@ -53,464 +56,413 @@ def _execute_called_move(battle_state: BattleState, move: Move) -> None:
     battle_state.current_move_slot = prev_slot
 
 
-def apply_primary(battle_state: BattleState) -> None:
-    effect = get_move_effect(battle_state.current_move)
-    # Meta-moves that select/execute another move immediately
-    if effect == MoveEffect.METRONOME:
-        # Deduct PP via script; execute called move with no PP deduction
-        chosen = meta_moves.select_metronome_move(battle_state)
-        if chosen == 0:
-            battle_state.move_result_flags |= MOVE_RESULT_FAILED
-            return
-        # Prevent called move from reducing PP
-        battle_state.hit_marker |= 1 << 2  # HITMARKER_NO_PPDEDUCT
-        _execute_called_move(battle_state, chosen)
-    elif effect == MoveEffect.NATURE_POWER:
-        chosen = meta_moves.select_nature_power_move(battle_state)
-        battle_state.hit_marker |= 1 << 2  # HITMARKER_NO_PPDEDUCT
-        _execute_called_move(battle_state, chosen)
-    elif effect == MoveEffect.ASSIST:
-        chosen = meta_moves.select_assist_move(battle_state, battle_state.battler_attacker)
-        if chosen == 0:
-            battle_state.move_result_flags |= MOVE_RESULT_FAILED
-            return
-        battle_state.hit_marker |= 1 << 2  # HITMARKER_NO_PPDEDUCT
-        _execute_called_move(battle_state, chosen)
-        return
-    elif effect == MoveEffect.SKETCH:
-        meta_moves.apply_sketch(battle_state)
-    elif effect == MoveEffect.ROLE_PLAY:
-        meta_moves.apply_role_play(battle_state)
-    elif effect == MoveEffect.SKILL_SWAP:
-        meta_moves.apply_skill_swap(battle_state)
-    elif effect == MoveEffect.FAKE_OUT:
-        # Fail if not the user's first turn on field (Gen 3 behavior)
-        uid = battle_state.battler_attacker
-        if battle_state.disable_structs[uid].isFirstTurn == 0:
-            # MOVE_RESULT_FAILED bit
-            battle_state.move_result_flags |= MOVE_RESULT_FAILED
-            return
-    if effect == MoveEffect.SLEEP:
-        status_effects.primary_sleep(battle_state)
-    elif effect == MoveEffect.TOXIC:
-        status_effects.primary_toxic(battle_state)
-    elif effect == MoveEffect.POISON:
-        status_effects.primary_poison(battle_state)
-    elif effect == MoveEffect.PROTECT:
-        field_effects.primary_protect(battle_state)
-    elif effect == MoveEffect.REFLECT:
-        field_effects.primary_reflect(battle_state)
-    elif effect == MoveEffect.LIGHT_SCREEN:
-        field_effects.primary_light_screen(battle_state)
-    elif effect == MoveEffect.SPIKES:
-        field_effects.primary_spikes(battle_state)
-    elif effect == MoveEffect.SAFEGUARD:
-        field_effects.primary_safeguard(battle_state)
-    elif effect == MoveEffect.MIST:
-        # Delegate to field effect to avoid duplication
-        field_effects.primary_mist(battle_state)
-    elif effect == MoveEffect.MINIMIZE:
-        status_effects.primary_minimize(battle_state)
-    elif effect == MoveEffect.ENDURE:
-        field_effects.primary_endure(battle_state)
-    elif effect == MoveEffect.SUBSTITUTE:
-        field_effects.primary_substitute(battle_state)
-    elif effect == MoveEffect.SEMI_INVULNERABLE:
-        # Two-turn moves that make the user semi-invulnerable on first turn
-        attacker_id = battle_state.battler_attacker
-        if not battle_state.protect_structs[attacker_id].chargingTurn:
-            two_turn.start_charging(battle_state)
-            # Set appropriate invulnerable flag based on move
-            if battle_state.current_move == Move.FLY:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, True)
-            elif battle_state.current_move == Move.DIG:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERGROUND, True)
-            elif battle_state.current_move == Move.DIVE:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERWATER, True)
-            elif battle_state.current_move == Move.BOUNCE:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, True)
-            # First turn ends here
-            return
-        else:
-            # Second turn: clear charging and invulnerable state, then resolve damage
-            if battle_state.current_move == Move.FLY:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, False)
-            elif battle_state.current_move == Move.DIG:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERGROUND, False)
-            elif battle_state.current_move == Move.DIVE:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERWATER, False)
-            elif battle_state.current_move == Move.BOUNCE:
-                two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, False)
-            two_turn.clear_charging(battle_state)
-            two_turn.resolve_two_turn_damage(battle_state)
-            # Bounce secondary: 30% chance to paralyze on successful connection
-            if battle_state.current_move == Move.BOUNCE:
-                r16 = rng.rand16(battle_state)
-                if (r16 % 100) < 30:
-                    status_effects.secondary_paralysis_bounce(battle_state)
-            return
-    elif effect in (MoveEffect.RAZOR_WIND, MoveEffect.SKY_ATTACK, MoveEffect.SOLAR_BEAM):
-        # Two-turn charging without semi-invulnerability
-        attacker_id = battle_state.battler_attacker
-        if not battle_state.protect_structs[attacker_id].chargingTurn:
-            two_turn.start_charging(battle_state)
-            return
-        else:
-            two_turn.clear_charging(battle_state)
-            # Solar Beam weather penalty (rain/sand/hail): halve damage after calc inside resolve
-            two_turn.resolve_two_turn_damage(battle_state)
-            return
-    # Stat raises (user)
-    elif effect == MoveEffect.ATTACK_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ATK, 1)
-    elif effect == MoveEffect.DEFENSE_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
-    elif effect == MoveEffect.SPEED_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPEED, 1)
-    elif effect == MoveEffect.SPECIAL_ATTACK_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPATK, 1)
-    elif effect == MoveEffect.SPECIAL_DEFENSE_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 1)
-    elif effect == MoveEffect.ACCURACY_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ACC, 1)
-    elif effect == MoveEffect.EVASION_UP:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_EVASION, 1)
-    elif effect == MoveEffect.ATTACK_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ATK, 2)
-    elif effect == MoveEffect.DEFENSE_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 2)
-    elif effect == MoveEffect.SPEED_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPEED, 2)
-    elif effect == MoveEffect.SPECIAL_ATTACK_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPATK, 2)
-    elif effect == MoveEffect.SPECIAL_DEFENSE_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 2)
-    elif effect == MoveEffect.ACCURACY_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ACC, 2)
-    elif effect == MoveEffect.EVASION_UP_2:
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_EVASION, 2)
-    # Stat lowers (target) for pure status versions
-    elif effect == MoveEffect.ATTACK_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ATK, 1)
-    elif effect == MoveEffect.DEFENSE_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_DEF, 1)
-    elif effect == MoveEffect.SPEED_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPEED, 1)
-    elif effect == MoveEffect.SPECIAL_ATTACK_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPATK, 1)
-    elif effect == MoveEffect.SPECIAL_DEFENSE_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPDEF, 1)
-    elif effect == MoveEffect.ACCURACY_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ACC, 1)
-    elif effect == MoveEffect.EVASION_DOWN:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_EVASION, 1)
-    elif effect == MoveEffect.ATTACK_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ATK, 2)
-    elif effect == MoveEffect.DEFENSE_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_DEF, 2)
-    elif effect == MoveEffect.SPEED_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPEED, 2)
-    elif effect == MoveEffect.SPECIAL_ATTACK_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPATK, 2)
-    elif effect == MoveEffect.SPECIAL_DEFENSE_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPDEF, 2)
-    elif effect == MoveEffect.ACCURACY_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ACC, 2)
-    elif effect == MoveEffect.EVASION_DOWN_2:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_EVASION, 2)
-    elif effect == MoveEffect.DRAGON_RAGE:
-        fixed_damage.effect_dragon_rage(battle_state)
-    elif effect == MoveEffect.SONICBOOM:
-        fixed_damage.effect_sonic_boom(battle_state)
-    elif effect == MoveEffect.LEVEL_DAMAGE:
-        fixed_damage.effect_level_damage(battle_state)
-    elif effect == MoveEffect.SUPER_FANG:
-        fixed_damage.effect_super_fang(battle_state)
-    elif effect == MoveEffect.ENDEAVOR:
-        fixed_damage.effect_endeavor(battle_state)
-    elif effect == MoveEffect.OHKO:
-        ohko.apply_ohko(battle_state)
-    elif effect == MoveEffect.MULTI_HIT:
-        # Perform 2-5 hits using distribution
-        # Twineedle is a special multi-hit with per-hit poison handling
-        if battle_state.current_move == Move.TWINEEDLE:
-            multi_hit.perform_twineedle(battle_state)
-        else:
-            multi_hit.perform_multi_hit(battle_state)
-    elif effect == MoveEffect.DOUBLE_HIT:
-        multi_hit.perform_multi_hit(battle_state, fixed_hits=2)
-    elif effect == MoveEffect.TRIPLE_KICK:
-        # Gen 3: 3 hits with escalating power 10/20/30
-        multi_hit.perform_triple_kick(battle_state)
-    elif effect == MoveEffect.BEAT_UP:
-        # Each healthy, status-free party member contributes a hit
-        meta_moves.apply_beat_up(battle_state)
-    elif effect == MoveEffect.HAZE:
-        field_effects.primary_haze(battle_state)
-    elif effect in (MoveEffect.RESTORE_HP,):
-        healing.primary_restore_half(battle_state)
-    elif effect in (MoveEffect.SOFTBOILED,):
-        healing.primary_restore_half(battle_state)
-    elif effect in (MoveEffect.REST,):
-        healing.primary_rest(battle_state)
-    elif effect == MoveEffect.SWALLOW:
-        status_effects.primary_swallow(battle_state)
-    elif effect == MoveEffect.WILL_O_WISP:
-        status_effects.primary_will_o_wisp(battle_state)
-    elif effect in (MoveEffect.MORNING_SUN, MoveEffect.SYNTHESIS, MoveEffect.MOONLIGHT):
-        healing.primary_weather_heal(battle_state)
-    elif effect == MoveEffect.LEECH_SEED:
-        status_effects.primary_leech_seed(battle_state)
-    elif effect == MoveEffect.TRAP:
-        # Bind/Wrap/Fire Spin/Clamp/Whirlpool/Sand Tomb all use EFFECT_TRAP
-        status_effects.primary_partial_trap(battle_state)
-    elif effect == MoveEffect.INGRAIN:
-        status_effects.primary_ingrain(battle_state)
-    elif effect == MoveEffect.DEFENSE_CURL:
-        status_effects.primary_defense_curl(battle_state)
-    elif effect == MoveEffect.CHARGE:
-        status_effects.primary_charge(battle_state)
-    elif effect == MoveEffect.UPROAR:
-        status_effects.primary_uproar(battle_state)
-    elif effect == MoveEffect.RAMPAGE:
-        status_effects.primary_rampage(battle_state)
-    elif effect == MoveEffect.WISH:
-        # Set wish to heal at end of next turn for the user position
-        b = battle_state.battler_attacker
-        battle_state.wish_future_knock.wishCounter[b] = 2  # heal after next turn passes
-        battle_state.wish_future_knock.wishMonId[b] = b
-        return
-    elif effect == MoveEffect.FOLLOW_ME:
-        support_moves.primary_follow_me(battle_state)
-    elif effect == MoveEffect.HELPING_HAND:
-        support_moves.primary_helping_hand(battle_state)
-    elif effect == MoveEffect.CAMOUFLAGE:
-        support_moves.primary_camouflage(battle_state)
-    elif effect == MoveEffect.YAWN:
-        status_effects.primary_yawn(battle_state)
-    elif effect == MoveEffect.BULK_UP:
-        # Raise user's Attack and Defense by 1
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ATK, 1)
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
-        return
-    elif effect == MoveEffect.CALM_MIND:
-        # Raise user's Sp. Atk and Sp. Def by 1
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPATK, 1)
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 1)
-        return
-    elif effect == MoveEffect.COSMIC_POWER:
-        # Raise user's Def and Sp. Def by 1
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 1)
-        return
-    elif effect == MoveEffect.DRAGON_DANCE:
-        # Raise user's Atk and Speed by 1
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ATK, 1)
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPEED, 1)
-        return
-    elif effect == MoveEffect.TICKLE:
-        # Lower target's Atk and Def by 1
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ATK, 1)
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_DEF, 1)
-        return
-    elif effect == MoveEffect.DESTINY_BOND:
-        # Set Destiny Bond volatile for this turn: on KO, the attacker faints too
-        user = battle_state.battler_attacker
-        battle_state.battlers[user].status2 |= Status2.DESTINY_BOND
-    elif effect == MoveEffect.GRUDGE:
-        # If user faints this turn from a move, the attacker's move loses all PP
-        battle_state.grudge_active[battle_state.battler_attacker] = True
-    elif effect == MoveEffect.PERISH_SONG:
-        support_moves.primary_perish_song(battle_state)
-    elif effect == MoveEffect.MEMENTO:
-        support_moves.primary_memento(battle_state)
-    elif effect == MoveEffect.PAY_DAY:
-        status_effects.primary_pay_day(battle_state)
-    elif effect == MoveEffect.FUTURE_SIGHT:
-        # Schedule delayed attack on target position after 2 turns
-        tid = battle_state.battler_target
-        battle_state.wish_future_knock.futureSightCounter[tid] = 3  # triggers after 2 full turns pass
-        battle_state.wish_future_knock.futureSightAttacker[tid] = battle_state.battler_attacker
-        battle_state.wish_future_knock.futureSightMove[tid] = battle_state.current_move
-        # Damage calculated on hit using stored attacker and move
+def _primary_metronome(battle_state: BattleState) -> None:
+    # Deduct PP via script; execute called move with no PP deduction
+    chosen = meta_moves.select_metronome_move(battle_state)
+    if chosen == 0:
+        battle_state.move_result_flags |= MOVE_RESULT_FAILED
         return
-    elif effect == MoveEffect.CONFUSE:
-        status_effects.primary_confuse(battle_state)
-    elif effect == MoveEffect.ATTRACT:
-        status_effects.primary_attract(battle_state)
-    elif effect == MoveEffect.TAUNT:
-        status_effects.primary_taunt(battle_state)
-    elif effect == MoveEffect.TORMENT:
-        status_effects.primary_torment(battle_state)
-    elif effect == MoveEffect.SWAGGER:
-        status_effects.primary_swagger(battle_state)
-    elif effect == MoveEffect.FLATTER:
-        status_effects.primary_flatter(battle_state)
-    elif effect == MoveEffect.FOCUS_ENERGY:
-        status_effects.primary_focus_energy(battle_state)
-    elif effect == MoveEffect.MEAN_LOOK:
-        # Apply escape prevention to the target
-        tid = battle_state.battler_target
-        mon = battle_state.battlers[tid]
-        if mon is not None:
-            mon.status2 |= Status2.ESCAPE_PREVENTION
-        return
-    elif effect == MoveEffect.PSYCH_UP:
-        # Copy target's stat stages to the user
-        uid = battle_state.battler_attacker
-        tid = battle_state.battler_target
-        user = battle_state.battlers[uid]
-        target = battle_state.battlers[tid]
-        if user is not None and target is not None:
-            user.statStages = target.statStages.copy()
-        return
-    elif effect == MoveEffect.DISABLE:
-        status_effects.primary_disable(battle_state)
-    elif effect == MoveEffect.SPITE:
-        status_effects.primary_spite(battle_state)
-    elif effect == MoveEffect.ENCORE:
-        status_effects.primary_encore(battle_state)
-    elif effect == MoveEffect.IMPRISON:
-        # User seals the moves it knows to prevent foes from using them
-        attacker_id = battle_state.battler_attacker
-        mon = battle_state.battlers[attacker_id]
-        if mon is not None:
-            battle_state.imprison_active[attacker_id] = True
-            # Copy moves
-            for i in range(4):
-                battle_state.imprison_moves[attacker_id][i] = mon.moves[i] if i < len(mon.moves) else Move.NONE
-        return
-    elif effect == MoveEffect.BATON_PASS:
-        # Baton Pass: mark baton pass active; on switch, carry allowed volatiles/stat stages.
-        # We'll approximate by setting a flag on the user to indicate pass on next switch.
-        user = battle_state.battler_attacker
-        # Use SpecialStatus.traced as a generic free flag to indicate pending baton pass
-        battle_state.special_statuses[user].traced = True
-        return
-    elif effect == MoveEffect.RAIN_DANCE:
-        battle_state.weather = Weather.RAIN
-        battle_state.weather_timer = WEATHER_DEFAULT_DURATION
-        return
-    elif effect == MoveEffect.SUNNY_DAY:
-        battle_state.weather = Weather.SUN
-        battle_state.weather_timer = WEATHER_DEFAULT_DURATION
-        return
-    elif effect == MoveEffect.SANDSTORM:
-        battle_state.weather = Weather.SANDSTORM
-        battle_state.weather_timer = WEATHER_DEFAULT_DURATION
-        return
-    elif effect == MoveEffect.HAIL:
-        battle_state.weather = Weather.HAIL
-        battle_state.weather_timer = WEATHER_DEFAULT_DURATION
+    # Prevent called move from reducing PP
+    battle_state.hit_marker |= 1 << 2  # HITMARKER_NO_PPDEDUCT
+    _execute_called_move(battle_state, chosen)
+
+
+def _primary_nature_power(battle_state: BattleState) -> None:
+    chosen = meta_moves.select_nature_power_move(battle_state)
+    battle_state.hit_marker |= 1 << 2  # HITMARKER_NO_PPDEDUCT
+    _execute_called_move(battle_state, chosen)
+
+
+def _primary_assist(battle_state: BattleState) -> None:
+    chosen = meta_moves.select_assist_move(battle_state, battle_state.battler_attacker)
+    if chosen == 0:
+        battle_state.move_result_flags |= MOVE_RESULT_FAILED
         return
-    elif effect == MoveEffect.MUD_SPORT:
-        status_effects.primary_mud_sport(battle_state)
+    battle_state.hit_marker |= 1 << 2  # HITMARKER_NO_PPDEDUCT
+    _execute_called_move(battle_state, chosen)
+
+
+def _primary_fake_out(battle_state: BattleState) -> None:
+    # Fail if not the user's first turn on field (Gen 3 behavior)
+    uid = battle_state.battler_attacker
+    if battle_state.disable_structs[uid].isFirstTurn == 0:
+        # MOVE_RESULT_FAILED bit
+        battle_state.move_result_flags |= MOVE_RESULT_FAILED
+
+
+def _primary_semi_invulnerable(battle_state: BattleState) -> None:
+    # Two-turn moves that make the user semi-invulnerable on first turn
+    attacker_id = battle_state.battler_attacker
+    move = battle_state.current_move
+    if not battle_state.protect_structs[attacker_id].chargingTurn:
+        two_turn.start_charging(battle_state)
+        # Set appropriate invulnerable flag based on move
+        if move == Move.FLY:
+            two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, True)
+        elif move == Move.DIG:
+            two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERGROUND, True)
+        elif move == Move.DIVE:
+            two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERWATER, True)
+        elif move == Move.BOUNCE:
+            two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, True)
+        # First turn ends here
         return
-    elif effect == MoveEffect.WATER_SPORT:
-        status_effects.primary_water_sport(battle_state)
+    # Second turn: clear charging and invulnerable state, then resolve damage
+    if move == Move.FLY:
+        two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, False)
+    elif move == Move.DIG:
+        two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERGROUND, False)
+    elif move == Move.DIVE:
+        two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.UNDERWATER, False)
+    elif move == Move.BOUNCE:
+        two_turn.set_semi_invulnerable(battle_state, SemiInvulnState.AIR, False)
+    two_turn.clear_charging(battle_state)
+    two_turn.resolve_two_turn_damage(battle_state)
+    # Bounce secondary: 30% chance to paralyze on successful connection
+    if move == Move.BOUNCE:
+        r16 = rng.rand16(battle_state)
+        if (r16 % 100) < 30:
+            status_effects.secondary_paralysis_bounce(battle_state)
+
+
+def _primary_two_turn_charge(battle_state: BattleState) -> None:
+    # Two-turn charging without semi-invulnerability
+    attacker_id = battle_state.battler_attacker
+    if not battle_state.protect_structs[attacker_id].chargingTurn:
+        two_turn.start_charging(battle_state)
         return
-    elif effect == MoveEffect.ROAR:
-        phazing.primary_phaze(battle_state)
-    elif effect == MoveEffect.COUNTER:
-        reaction_moves.primary_counter(battle_state)
-    elif effect == MoveEffect.MIRROR_COAT:
-        reaction_moves.primary_mirror_coat(battle_state)
-    elif effect == MoveEffect.MAGIC_COAT:
-        reaction_moves.primary_magic_coat(battle_state)
-    elif effect == MoveEffect.SNATCH:
-        reaction_moves.primary_snatch(battle_state)
-    elif effect == MoveEffect.BIDE:
-        reaction_moves.primary_bide(battle_state)
-    # New primary effects wiring
-    elif effect == MoveEffect.FORESIGHT:
-        status_effects.primary_foresight(battle_state)
-    elif effect == MoveEffect.LOCK_ON:
-        status_effects.primary_lock_on(battle_state)
-    elif effect == MoveEffect.REFRESH:
-        status_effects.primary_refresh(battle_state)
-    elif effect == MoveEffect.HEAL_BELL:
-        status_effects.primary_heal_bell(battle_state)
-    elif effect == MoveEffect.TEETER_DANCE:
-        status_effects.primary_teeter_dance(battle_state)
+    two_turn.clear_charging(battle_state)
+    # Solar Beam weather penalty (rain/sand/hail): halve damage after calc inside resolve
+    two_turn.resolve_two_turn_damage(battle_state)
+
+
+def _primary_multi_hit(battle_state: BattleState) -> None:
+    # Perform 2-5 hits using distribution
+    # Twineedle is a special multi-hit with per-hit poison handling
+    if battle_state.current_move == Move.TWINEEDLE:
+        multi_hit.perform_twineedle(battle_state)
+    else:
+        multi_hit.perform_multi_hit(battle_state)
+
+
+def _primary_wish(battle_state: BattleState) -> None:
+    # Set wish to heal at end of next turn for the user position
+    b = battle_state.battler_attacker
+    battle_state.wish_future_knock.wishCounter[b] = 2  # heal after next turn passes
+    battle_state.wish_future_knock.wishMonId[b] = b
+
+
+def _primary_bulk_up(battle_state: BattleState) -> None:
+    # Raise user's Attack and Defense by 1
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ATK, 1)
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
+
+
+def _primary_calm_mind(battle_state: BattleState) -> None:
+    # Raise user's Sp. Atk and Sp. Def by 1
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPATK, 1)
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 1)
+
+
+def _primary_cosmic_power(battle_state: BattleState) -> None:
+    # Raise user's Def and Sp. Def by 1
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 1)
+
+
+def _primary_dragon_dance(battle_state: BattleState) -> None:
+    # Raise user's Atk and Speed by 1
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_ATK, 1)
+    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPEED, 1)
+
+
+def _primary_tickle(battle_state: BattleState) -> None:
+    # Lower target's Atk and Def by 1
+    stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ATK, 1)
+    stat_changes.lower_stat_target(battle_state, stat_changes.STAT_DEF, 1)
+
+
+def _primary_destiny_bond(battle_state: BattleState) -> None:
+    # Set Destiny Bond volatile for this turn: on KO, the attacker faints too
+    user = battle_state.battler_attacker
+    battle_state.battlers[user].status2 |= Status2.DESTINY_BOND
+
+
+def _primary_grudge(battle_state: BattleState) -> None:
+    # If user faints this turn from a move, the attacker's move loses all PP
+    battle_state.grudge_active[battle_state.battler_attacker] = True
+
+
+def _primary_future_sight(battle_state: BattleState) -> None:
+    # Schedule delayed attack on target position after 2 turns
+    tid = battle_state.battler_target
+    battle_state.wish_future_knock.futureSightCounter[tid] = 3  # triggers after 2 full turns pass
+    battle_state.wish_future_knock.futureSightAttacker[tid] = battle_state.battler_attacker
+    battle_state.wish_future_knock.futureSightMove[tid] = battle_state.current_move
+    # Damage calculated on hit using stored attacker and move
+
+
+def _primary_mean_look(battle_state: BattleState) -> None:
+    # Apply escape prevention to the target
+    tid = battle_state.battler_target
+    mon = battle_state.battlers[tid]
+    if mon is not None:
+        mon.status2 |= Status2.ESCAPE_PREVENTION
+
+
+def _primary_psych_up(battle_state: BattleState) -> None:
+    # Copy target's stat stages to the user
+    uid = battle_state.battler_attacker
+    tid = battle_state.battler_target
+    user = battle_state.battlers[uid]
+    target = battle_state.battlers[tid]
+    if user is not None and target is not None:
+        # In-place store into the user's existing stage buffer (no new list)
+        user.statStages[:] = target.statStages
+
+
+def _primary_imprison(battle_state: BattleState) -> None:
+    # User seals the moves it knows to prevent foes from using them
+    attacker_id = battle_state.battler_attacker
+    mon = battle_state.battlers[attacker_id]
+    if mon is not None:
+        battle_state.imprison_active[attacker_id] = True
+        # Copy moves (BattlePokemon.moves is always exactly MAX_MON_MOVES long)
+        battle_state.imprison_moves[attacker_id][:] = mon.moves
+
+
+def _primary_baton_pass(battle_state: BattleState) -> None:
+    # Baton Pass: mark baton pass active; on switch, carry allowed volatiles/stat stages.
+    # We'll approximate by setting a flag on the user to indicate pass on next switch.
+    user = battle_state.battler_attacker
+    # Use SpecialStatus.traced as a generic free flag to indicate pending baton pass
+    battle_state.special_statuses[user].traced = True
+
+
+def _primary_set_weather(battle_state: BattleState, weather: Weather) -> None:
+    battle_state.weather = weather
+    battle_state.weather_timer = WEATHER_DEFAULT_DURATION
+
+
+# Primary effect dispatch table - maps a move's effect to its handler.
+# Mirrors the role of gBattleScriptingCommandsTable[] for move effects: one dict
+# lookup per move instead of walking a long if/elif chain.
+_PRIMARY_EFFECT_HANDLERS: dict[MoveEffect, Callable[[BattleState], object]] = {
+    # Meta-moves that select/execute another move immediately
+    MoveEffect.METRONOME: _primary_metronome,
+    MoveEffect.NATURE_POWER: _primary_nature_power,
+    MoveEffect.ASSIST: _primary_assist,
+    MoveEffect.SKETCH: meta_moves.apply_sketch,
+    MoveEffect.ROLE_PLAY: meta_moves.apply_role_play,
+    MoveEffect.SKILL_SWAP: meta_moves.apply_skill_swap,
+    MoveEffect.FAKE_OUT: _primary_fake_out,
+    MoveEffect.SLEEP: status_effects.primary_sleep,
+    MoveEffect.TOXIC: status_effects.primary_toxic,
+    MoveEffect.POISON: status_effects.primary_poison,
+    MoveEffect.PROTECT: field_effects.primary_protect,
+    MoveEffect.REFLECT: field_effects.primary_reflect,
+    MoveEffect.LIGHT_SCREEN: field_effects.primary_light_screen,
+    MoveEffect.SPIKES: field_effects.primary_spikes,
+    MoveEffect.SAFEGUARD: field_effects.primary_safeguard,
+    # Delegate to field effect to avoid duplication
+    MoveEffect.MIST: field_effects.primary_mist,
+    MoveEffect.MINIMIZE: status_effects.primary_minimize,
+    MoveEffect.ENDURE: field_effects.primary_endure,
+    MoveEffect.SUBSTITUTE: field_effects.primary_substitute,
+    MoveEffect.SEMI_INVULNERABLE: _primary_semi_invulnerable,
+    MoveEffect.RAZOR_WIND: _primary_two_turn_charge,
+    MoveEffect.SKY_ATTACK: _primary_two_turn_charge,
+    MoveEffect.SOLAR_BEAM: _primary_two_turn_charge,
+    # Stat raises (user)
+    MoveEffect.ATTACK_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_ATK, stages=1),
+    MoveEffect.DEFENSE_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_DEF, stages=1),
+    MoveEffect.SPEED_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_SPEED, stages=1),
+    MoveEffect.SPECIAL_ATTACK_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_SPATK, stages=1),
+    MoveEffect.SPECIAL_DEFENSE_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_SPDEF, stages=1),
+    MoveEffect.ACCURACY_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_ACC, stages=1),
+    MoveEffect.EVASION_UP: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_EVASION, stages=1),
+    MoveEffect.ATTACK_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_ATK, stages=2),
+    MoveEffect.DEFENSE_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_DEF, stages=2),
+    MoveEffect.SPEED_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_SPEED, stages=2),
+    MoveEffect.SPECIAL_ATTACK_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_SPATK, stages=2),
+    MoveEffect.SPECIAL_DEFENSE_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_SPDEF, stages=2),
+    MoveEffect.ACCURACY_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_ACC, stages=2),
+    MoveEffect.EVASION_UP_2: partial(stat_changes.raise_stat_user, stat_index=stat_changes.STAT_EVASION, stages=2),
+    # Stat lowers (target) for pure status versions
+    MoveEffect.ATTACK_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ATK, stages=1),
+    MoveEffect.DEFENSE_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_DEF, stages=1),
+    MoveEffect.SPEED_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPEED, stages=1),
+    MoveEffect.SPECIAL_ATTACK_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPATK, stages=1),
+    MoveEffect.SPECIAL_DEFENSE_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPDEF, stages=1),
+    MoveEffect.ACCURACY_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ACC, stages=1),
+    MoveEffect.EVASION_DOWN: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_EVASION, stages=1),
+    MoveEffect.ATTACK_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ATK, stages=2),
+    MoveEffect.DEFENSE_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_DEF, stages=2),
+    MoveEffect.SPEED_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPEED, stages=2),
+    MoveEffect.SPECIAL_ATTACK_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPATK, stages=2),
+    MoveEffect.SPECIAL_DEFENSE_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPDEF, stages=2),
+    MoveEffect.ACCURACY_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ACC, stages=2),
+    MoveEffect.EVASION_DOWN_2: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_EVASION, stages=2),
+    MoveEffect.DRAGON_RAGE: fixed_damage.effect_dragon_rage,
+    MoveEffect.SONICBOOM: fixed_damage.effect_sonic_boom,
+    MoveEffect.LEVEL_DAMAGE: fixed_damage.effect_level_damage,
+    MoveEffect.SUPER_FANG: fixed_damage.effect_super_fang,
+    MoveEffect.ENDEAVOR: fixed_damage.effect_endeavor,
+    MoveEffect.OHKO: ohko.apply_ohko,
+    MoveEffect.MULTI_HIT: _primary_multi_hit,
+    MoveEffect.DOUBLE_HIT: partial(multi_hit.perform_multi_hit, fixed_hits=2),
+    # Gen 3: 3 hits with escalating power 10/20/30
+    MoveEffect.TRIPLE_KICK: multi_hit.perform_triple_kick,
+    # Each healthy, status-free party member contributes a hit
+    MoveEffect.BEAT_UP: meta_moves.apply_beat_up,
+    MoveEffect.HAZE: field_effects.primary_haze,
+    MoveEffect.RESTORE_HP: healing.primary_restore_half,
+    MoveEffect.SOFTBOILED: healing.primary_restore_half,
+    MoveEffect.REST: healing.primary_rest,
+    MoveEffect.SWALLOW: status_effects.primary_swallow,
+    MoveEffect.WILL_O_WISP: status_effects.primary_will_o_wisp,
+    MoveEffect.MORNING_SUN: healing.primary_weather_heal,
+    MoveEffect.SYNTHESIS: healing.primary_weather_heal,
+    MoveEffect.MOONLIGHT: healing.primary_weather_heal,
+    MoveEffect.LEECH_SEED: status_effects.primary_leech_seed,
+    # Bind/Wrap/Fire Spin/Clamp/Whirlpool/Sand Tomb all use EFFECT_TRAP
+    MoveEffect.TRAP: status_effects.primary_partial_trap,
+    MoveEffect.INGRAIN: status_effects.primary_ingrain,
+    MoveEffect.DEFENSE_CURL: status_effects.primary_defense_curl,
+    MoveEffect.CHARGE: status_effects.primary_charge,
+    MoveEffect.UPROAR: status_effects.primary_uproar,
+    MoveEffect.RAMPAGE: status_effects.primary_rampage,
+    MoveEffect.WISH: _primary_wish,
+    MoveEffect.FOLLOW_ME: support_moves.primary_follow_me,
+    MoveEffect.HELPING_HAND: support_moves.primary_helping_hand,
+    MoveEffect.CAMOUFLAGE: support_moves.primary_camouflage,
+    MoveEffect.YAWN: status_effects.primary_yawn,
+    MoveEffect.BULK_UP: _primary_bulk_up,
+    MoveEffect.CALM_MIND: _primary_calm_mind,
+    MoveEffect.COSMIC_POWER: _primary_cosmic_power,
+    MoveEffect.DRAGON_DANCE: _primary_dragon_dance,
+    MoveEffect.TICKLE: _primary_tickle,
+    MoveEffect.DESTINY_BOND: _primary_destiny_bond,
+    MoveEffect.GRUDGE: _primary_grudge,
+    MoveEffect.PERISH_SONG: support_moves.primary_perish_song,
+    MoveEffect.MEMENTO: support_moves.primary_memento,
+    MoveEffect.PAY_DAY: status_effects.primary_pay_day,
+    MoveEffect.FUTURE_SIGHT: _primary_future_sight,
+    MoveEffect.CONFUSE: status_effects.primary_confuse,
+    MoveEffect.ATTRACT: status_effects.primary_attract,
+    MoveEffect.TAUNT: status_effects.primary_taunt,
+    MoveEffect.TORMENT: status_effects.primary_torment,
+    MoveEffect.SWAGGER: status_effects.primary_swagger,
+    MoveEffect.FLATTER: status_effects.primary_flatter,
+    MoveEffect.FOCUS_ENERGY: status_effects.primary_focus_energy,
+    MoveEffect.MEAN_LOOK: _primary_mean_look,
+    MoveEffect.PSYCH_UP: _primary_psych_up,
+    MoveEffect.DISABLE: status_effects.primary_disable,
+    MoveEffect.SPITE: status_effects.primary_spite,
+    MoveEffect.ENCORE: status_effects.primary_encore,
+    MoveEffect.IMPRISON: _primary_imprison,
+    MoveEffect.BATON_PASS: _primary_baton_pass,
+    MoveEffect.RAIN_DANCE: partial(_primary_set_weather, weather=Weather.RAIN),
+    MoveEffect.SUNNY_DAY: partial(_primary_set_weather, weather=Weather.SUN),
+    MoveEffect.SANDSTORM: partial(_primary_set_weather, weather=Weather.SANDSTORM),
+    MoveEffect.HAIL: partial(_primary_set_weather, weather=Weather.HAIL),
+    MoveEffect.MUD_SPORT: status_effects.primary_mud_sport,
+    MoveEffect.WATER_SPORT: status_effects.primary_water_sport,
+    MoveEffect.ROAR: phazing.primary_phaze,
+    MoveEffect.COUNTER: reaction_moves.primary_counter,
+    MoveEffect.MIRROR_COAT: reaction_moves.primary_mirror_coat,
+    MoveEffect.MAGIC_COAT: reaction_moves.primary_magic_coat,
+    MoveEffect.SNATCH: reaction_moves.primary_snatch,
+    MoveEffect.BIDE: reaction_moves.primary_bide,
+    MoveEffect.FORESIGHT: status_effects.primary_foresight,
+    MoveEffect.LOCK_ON: status_effects.primary_lock_on,
+    MoveEffect.REFRESH: status_effects.primary_refresh,
+    MoveEffect.HEAL_BELL: status_effects.primary_heal_bell,
+    MoveEffect.TEETER_DANCE: status_effects.primary_teeter_dance,
     # Add more primary effects as implemented
+}
 
 
-def apply_secondary(battle_state: BattleState) -> None:
-    effect = get_move_effect(battle_state.current_move)
-    # Special-case Secret Power to map secondary by environment
-    if effect == MoveEffect.SECRET_POWER:
-        meta_moves.apply_secret_power_secondary(battle_state)
+def apply_primary(battle_state: BattleState) -> None:
+    handler = _PRIMARY_EFFECT_HANDLERS.get(get_move_effect(battle_state.current_move))
+    if handler is not None:
+        handler(battle_state)
+
+
+def _secondary_recoil(battle_state: BattleState) -> None:
+    # Apply exact recoil ratios per move
+    atk = battle_state.battlers[battle_state.battler_attacker]
+    if atk is not None:
+        atk.hp = recoil_and_drain.apply_recoil_for_move(atk.hp, battle_state.current_move, battle_state.script_damage)
+
+
+def _secondary_recoil_if_miss(battle_state: BattleState) -> None:
+    # Crash damage on miss: apply after accuracy fail path; here we emulate in secondary hook when flagged
+    if not battle_state.move_result_flags & MOVE_RESULT_MISSED:
         return
-    if effect == MoveEffect.POISON_HIT:
-        status_effects.secondary_poison(battle_state)
-    elif effect == MoveEffect.BURN_HIT:
-        status_effects.secondary_burn(battle_state)
-    elif effect == MoveEffect.PARALYZE_HIT:
-        status_effects.secondary_paralysis(battle_state)
-    elif effect == MoveEffect.FREEZE_HIT:
-        status_effects.secondary_freeze(battle_state)
-    elif effect == MoveEffect.FLINCH_HIT:
-        status_effects.secondary_flinch(battle_state)
-    elif effect == MoveEffect.CONFUSE_HIT:
-        status_effects.secondary_confuse(battle_state)
-    elif effect == MoveEffect.ATTACK_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ATK, 1)
-    elif effect == MoveEffect.DEFENSE_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_DEF, 1)
-    elif effect == MoveEffect.SPEED_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPEED, 1)
-    elif effect == MoveEffect.SPECIAL_ATTACK_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPATK, 1)
-    elif effect == MoveEffect.SPECIAL_DEFENSE_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPDEF, 1)
-    elif effect == MoveEffect.ACCURACY_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ACC, 1)
-    elif effect == MoveEffect.EVASION_DOWN_HIT:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_EVASION, 1)
-    elif effect == MoveEffect.ABSORB:
-        # Heal 1/2 of damage dealt
-        recoil_and_drain.apply_drain_heal(battle_state, 1, 2)
-    elif effect == MoveEffect.RECOIL:
-        # Apply exact recoil ratios per move
-        atk = battle_state.battlers[battle_state.battler_attacker]
-        if atk is not None:
-            atk.hp = recoil_and_drain.apply_recoil_for_move(atk.hp, battle_state.current_move, battle_state.script_damage)
-    elif effect == MoveEffect.RECOIL_IF_MISS:
-        # Crash damage on miss: apply after accuracy fail path; here we emulate in secondary hook when flagged
-        atk = battle_state.battlers[battle_state.battler_attacker]
-        if atk is not None and (battle_state.move_result_flags & MOVE_RESULT_MISSED):
-            # Use 1/2 of would-be damage as crash fallback; Gen 3 uses manipulatedamage DMG_RECOIL_FROM_MISS
-            atk.hp = recoil_and_drain.apply_recoil(atk.hp, 1, 2, max(1, battle_state.script_damage))
-    elif effect == MoveEffect.RAPID_SPIN:
-        removal_effects.secondary_rapid_spin(battle_state)
-    elif effect == MoveEffect.BRICK_BREAK:
-        removal_effects.secondary_brick_break(battle_state)
-    elif effect == MoveEffect.KNOCK_OFF:
-        item_interactions.secondary_knock_off(battle_state)
-    elif effect == MoveEffect.THIEF:
-        item_interactions.secondary_thief_covet(battle_state)
-    elif effect == MoveEffect.TRICK:
-        item_interactions.secondary_trick(battle_state)
-    elif effect == MoveEffect.SMELLINGSALT:
-        # Cure paralysis on the target if it was paralyzed
-        status_effects.secondary_smellingsalt(battle_state)
-    elif effect == MoveEffect.SKY_ATTACK:
-        status_effects.secondary_flinch_sky_attack(battle_state)
-    elif effect == MoveEffect.FLINCH_MINIMIZE_HIT:
-        status_effects.secondary_flinch_minimize_family(battle_state)
-    elif effect == MoveEffect.OVERHEAT:
-        status_effects.secondary_overheat_user_drop(battle_state)
-    elif effect == MoveEffect.POISON_FANG:
-        status_effects.secondary_badly_poison(battle_state)
-    elif effect == MoveEffect.BLAZE_KICK:
-        status_effects.secondary_burn(battle_state)
-    elif effect == MoveEffect.POISON_TAIL:
-        status_effects.secondary_poison(battle_state)
+    atk = battle_state.battlers[battle_state.battler_attacker]
+    if atk is not None:
+        # Use 1/2 of would-be damage as crash fallback; Gen 3 uses manipulatedamage DMG_RECOIL_FROM_MISS
+        atk.hp = recoil_and_drain.apply_recoil(atk.hp, 1, 2, max(1, battle_state.script_damage))
+
+
+# Secondary effect dispatch table (see _PRIMARY_EFFECT_HANDLERS)
+_SECONDARY_EFFECT_HANDLERS: dict[MoveEffect, Callable[[BattleState], object]] = {
+    # Special-case Secret Power to map secondary by environment
+    MoveEffect.SECRET_POWER: meta_moves.apply_secret_power_secondary,
+    MoveEffect.POISON_HIT: status_effects.secondary_poison,
+    MoveEffect.BURN_HIT: status_effects.secondary_burn,
+    MoveEffect.PARALYZE_HIT: status_effects.secondary_paralysis,
+    MoveEffect.FREEZE_HIT: status_effects.secondary_freeze,
+    MoveEffect.FLINCH_HIT: status_effects.secondary_flinch,
+    MoveEffect.CONFUSE_HIT: status_effects.secondary_confuse,
+    MoveEffect.ATTACK_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ATK, stages=1),
+    MoveEffect.DEFENSE_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_DEF, stages=1),
+    MoveEffect.SPEED_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPEED, stages=1),
+    MoveEffect.SPECIAL_ATTACK_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPATK, stages=1),
+    MoveEffect.SPECIAL_DEFENSE_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPDEF, stages=1),
+    MoveEffect.ACCURACY_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ACC, stages=1),
+    MoveEffect.EVASION_DOWN_HIT: partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_EVASION, stages=1),
+    # Heal 1/2 of damage dealt
+    MoveEffect.ABSORB: partial(recoil_and_drain.apply_drain_heal, fraction_num=1, fraction_den=2),
+    MoveEffect.RECOIL: _secondary_recoil,
+    MoveEffect.RECOIL_IF_MISS: _secondary_recoil_if_miss,
+    MoveEffect.RAPID_SPIN: removal_effects.secondary_rapid_spin,
+    MoveEffect.BRICK_BREAK: removal_effects.secondary_brick_break,
+    MoveEffect.KNOCK_OFF: item_interactions.secondary_knock_off,
+    MoveEffect.THIEF: item_interactions.secondary_thief_covet,
+    MoveEffect.TRICK: item_interactions.secondary_trick,
+    # Cure paralysis on the target if it was paralyzed
+    MoveEffect.SMELLINGSALT: status_effects.secondary_smellingsalt,
+    MoveEffect.SKY_ATTACK: status_effects.secondary_flinch_sky_attack,
+    MoveEffect.FLINCH_MINIMIZE_HIT: status_effects.secondary_flinch_minimize_family,
+    MoveEffect.OVERHEAT: status_effects.secondary_overheat_user_drop,
+    MoveEffect.POISON_FANG: status_effects.secondary_badly_poison,
+    MoveEffect.BLAZE_KICK: status_effects.secondary_burn,
+    MoveEffect.POISON_TAIL: status_effects.secondary_poison,
     # Add more secondary effects as implemented
+}
+
+
+def apply_secondary(battle_state: BattleState) -> None:
+    handler = _SECONDARY_EFFECT_HANDLERS.get(get_move_effect(battle_state.current_move))
+    if handler is not None:
+        handler(battle_state)
+
+
+# Secondary effect chance per move, keeping only moves that have one. Most moves
+# have no secondary effect, so apply_with_chance can bail before any other lookups.
+_SECONDARY_CHANCE_BY_MOVE: dict[Move, int] = {
+    move: move_data.secondaryEffectChance for move, move_data in BATTLE_MOVES.items() if move_data.secondaryEffectChance
+}
 
 
 def apply_with_chance(battle_state: BattleState) -> None:
     # Based on Cmd_seteffectwithchance in battle_script_commands.c
+    percent = _SECONDARY_CHANCE_BY_MOVE.get(battle_state.current_move, 0)
+    if percent <= 0:
+        return
+
     attacker_id = battle_state.battler_attacker
     target_id = battle_state.battler_target
     attacker = battle_state.battlers[attacker_id]
@@ -519,22 +471,14 @@ def apply_with_chance(battle_state: BattleState) -> None:
     if attacker is None or target is None:
         return
 
-    move_data = get_move_data(battle_state.current_move)
-    if not move_data:
-        return
-
     # Shield Dust prevents secondary effects that would affect the holder
     if target.ability == Ability.SHIELD_DUST:
         return
 
-    # Compute percent chance; Serene Grace doubles
-    percent = move_data.secondaryEffectChance or 0
-    if attacker.ability == Ability.SERENE_GRACE and percent > 0:
+    # Serene Grace doubles the chance
+    if attacker.ability == Ability.SERENE_GRACE:
         percent = min(100, percent * 2)
 
-    if percent <= 0:
-        return
-
     roll = rng.rand16(battle_state)
     threshold = (percent * 0xFFFF) // 100
     if roll < threshold:
@@ -3,6 +3,7 @@ from src.battle_factory.enums import Ability
 from src.battle_factory.enums.status import Status2
 from src.battle_factory.schema.battle_pokemon import BattlePokemon
 from src.battle_factory.utils import rng
+from src.battle_factory.constants import DEFAULT_STAT_STAGE, NUM_BATTLE_STATS
 
 # Side status bitmasks from include/constants/battle.h
 SIDE_STATUS_REFLECT = 1 << 0
@@ -15,6 +16,9 @@ SIDE_STATUS_MIST = 1 << 8
 # Values approximate sProtectSuccessRates; success if threshold >= Random16
 _PROTECT_THRESHOLDS = [0xFFFF, 0x7FFF, 0x3FFF, 0x1FFF, 0x0FFF, 0x07FF, 0x03FF]
 
+# Haze resets every battle stat stage except HP (index 0) back to neutral
+_HAZE_RESET_STAGES = (DEFAULT_STAT_STAGE,) * (NUM_BATTLE_STATS - 1)
+
 
 def primary_protect(battle_state: BattleState) -> None:
     """Apply Protect success with chaining odds.
@@ -82,8 +86,7 @@ def primary_substitute(battle_state: BattleState) -> None:
 
 def primary_reflect(battle_state: BattleState) -> None:
     """Set Reflect side status and 5-turn timer (Gen 3)."""
-    attacker_id = battle_state.battler_attacker
-    side = attacker_id % 2
+    side = battle_state.battler_attacker & 1
     # Set side status bit and timer (5 turns in Emerald)
     battle_state.side_statuses[side] |= SIDE_STATUS_REFLECT
     battle_state.reflect_timers[side] = 5
@@ -91,8 +94,7 @@ def primary_reflect(battle_state: BattleState) -> None:
 
 def primary_light_screen(battle_state: BattleState) -> None:
     """Set Light Screen side status and 5-turn timer (Gen 3)."""
-    attacker_id = battle_state.battler_attacker
-    side = attacker_id % 2
+    side = battle_state.battler_attacker & 1
     battle_state.side_statuses[side] |= SIDE_STATUS_LIGHTSCREEN
     battle_state.light_screen_timers[side] = 5
 
@@ -100,28 +102,27 @@ def primary_light_screen(battle_state: BattleState) -> None:
 def primary_spikes(battle_state: BattleState) -> None:
     """Add a layer of Spikes to the opposing side (max 3 layers)."""
     # Spikes are set on the target's side
-    attacker_id = battle_state.battler_attacker
-    opponent_side = 1 - (attacker_id % 2)
+    opponent_side = (battle_state.battler_attacker & 1) ^ 1
     # spikes_layers ranges 0..3
-    layers = battle_state.spikes_layers[opponent_side]
-    # Set side bit when at least one layer exists
-    if layers < 3:
-        battle_state.spikes_layers[opponent_side] = layers + 1
+    spikes_layers = battle_state.spikes_layers
+    layers = spikes_layers[opponent_side]
+    # Side bit mirrors "at least one layer exists", so it only needs setting on the first layer
+    if layers == 0:
         battle_state.side_statuses[opponent_side] |= SIDE_STATUS_SPIKES
+    if layers < 3:
+        spikes_layers[opponent_side] = layers + 1
 
 
 def primary_safeguard(battle_state: BattleState) -> None:
     """Set Safeguard side status and 5-turn timer (Gen 3)."""
-    attacker_id = battle_state.battler_attacker
-    side = attacker_id % 2
+    side = battle_state.battler_attacker & 1
     battle_state.side_statuses[side] |= SIDE_STATUS_SAFEGUARD
     battle_state.safeguard_timers[side] = 5
 
 
 def primary_mist(battle_state: BattleState) -> None:
     """Set Mist side status and 5-turn timer (Gen 3)."""
-    attacker_id = battle_state.battler_attacker
-    side = attacker_id % 2
+    side = battle_state.battler_attacker & 1
     # Set Mist side bit; in Emerald, Mist duration is tracked (SideTimer.mistTimer), we mirror with 5 turns
     battle_state.side_statuses[side] |= SIDE_STATUS_MIST
     # Track Mist duration in battle_state.mist_timers; end-turn clears SIDE_STATUS_MIST when timer reaches 0.
@@ -133,5 +134,4 @@ def primary_haze(battle_state: BattleState) -> None:
     for mon in battle_state.battlers:
         if isinstance(mon, BattlePokemon):
             # statStages length is 8; keep HP index (0) untouched in Gen 3; we reset indices 1..7 to 6
-            for idx in range(1, len(mon.statStages)):
-                mon.statStages[idx] = 6
+            mon.statStages[1:] = _HAZE_RESET_STAGES
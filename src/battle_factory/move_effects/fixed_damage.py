@@ -2,16 +2,9 @@ from src.battle_factory.schema.battle_state import BattleState
 from src.battle_factory.enums import Move
 
 
-def set_fixed_damage(battle_state: BattleState, amount: int) -> None:
-    """Set fixed damage amount for script handling.
-
-    Used by fixed-damage effects to place the computed value into
-    gBattleMoveDamage/script_damage for subsequent HP update.
-
-    Source: pokeemerald/src/battle_script_commands.c (Cmd_manipulatedamage cases)
-    """
-    battle_state.battle_move_damage = max(0, amount)
-    battle_state.script_damage = battle_state.battle_move_damage
+# Fixed-damage effects place the computed value into gBattleMoveDamage/script_damage
+# for the subsequent HP update (Cmd_manipulatedamage cases in battle_script_commands.c).
+# All amounts below are non-negative, so they are stored directly.
 
 
 def effect_dragon_rage(battle_state: BattleState) -> None:
@@ -19,7 +12,8 @@ def effect_dragon_rage(battle_state: BattleState) -> None:
 
     Source: data/battle_scripts_1.s (BattleScript_EffectDragonRage)
     """
-    set_fixed_damage(battle_state, 40)
+    battle_state.battle_move_damage = 40
+    battle_state.script_damage = 40
 
 
 def effect_sonic_boom(battle_state: BattleState) -> None:
@@ -27,7 +21,8 @@ def effect_sonic_boom(battle_state: BattleState) -> None:
 
     Source: data/battle_scripts_1.s (BattleScript_EffectSonicBoom)
     """
-    set_fixed_damage(battle_state, 20)
+    battle_state.battle_move_damage = 20
+    battle_state.script_damage = 20
 
 
 def effect_level_damage(battle_state: BattleState) -> None:
@@ -36,7 +31,9 @@ def effect_level_damage(battle_state: BattleState) -> None:
     Source: data/battle_scripts_1.s (BattleScript_EffectLevelDamage)
     """
     attacker = battle_state.battlers[battle_state.battler_attacker]
-    set_fixed_damage(battle_state, attacker.level if attacker else 0)
+    dmg = attacker.level if attacker is not None else 0
+    battle_state.battle_move_damage = dmg
+    battle_state.script_damage = dmg
 
 
 def effect_super_fang(battle_state: BattleState) -> None:
@@ -45,13 +42,15 @@ def effect_super_fang(battle_state: BattleState) -> None:
     Source: data/battle_scripts_1.s (BattleScript_EffectSuperFang)
     """
     target = battle_state.battlers[battle_state.battler_target]
-    if not target or target.hp <= 0:
-        set_fixed_damage(battle_state, 0)
+    if target is None or target.hp <= 0:
+        battle_state.battle_move_damage = 0
+        battle_state.script_damage = 0
         return
     dmg = target.hp // 2
     if dmg < 1:
         dmg = 1
-    set_fixed_damage(battle_state, dmg)
+    battle_state.battle_move_damage = dmg
+    battle_state.script_damage = dmg
 
 
 def effect_endeavor(battle_state: BattleState) -> None:
@@ -62,11 +61,10 @@ def effect_endeavor(battle_state: BattleState) -> None:
     """
     attacker = battle_state.battlers[battle_state.battler_attacker]
     target = battle_state.battlers[battle_state.battler_target]
-    if not attacker or not target:
-        set_fixed_damage(battle_state, 0)
-        return
-    if attacker.hp >= target.hp:
-        set_fixed_damage(battle_state, 0)
+    if attacker is None or target is None or attacker.hp >= target.hp:
+        battle_state.battle_move_damage = 0
+        battle_state.script_damage = 0
         return
     dmg = target.hp - attacker.hp
-    set_fixed_damage(battle_state, dmg)
+    battle_state.battle_move_damage = dmg
+    battle_state.script_damage = dmg
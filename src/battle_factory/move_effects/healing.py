@@ -1,18 +1,18 @@
 from src.battle_factory.schema.battle_state import BattleState
-from src.battle_factory.schema.battle_pokemon import BattlePokemon
 from src.battle_factory.enums import Ability, Weather
 from src.battle_factory.enums.status import Status1
 
 
-def _apply_heal(mon: BattlePokemon, amount: int) -> int:
-    """Apply healing to a battler and return amount restored.
+def _apply_heal(hp: int, max_hp: int, amount: int) -> tuple[int, int]:
+    """Heal hp by amount (capped at max_hp) and return (new_hp, amount restored).
+
+    Works on plain ints so callers read the battler's HP fields once and store mon.hp once.
 
     Source: pokeemerald/src/battle_script_commands.c (Cmd_manipulatedamage for
     healing families) and HP updates in Cmd_datahpupdate.
     """
-    before = mon.hp
-    mon.hp = min(mon.maxHP, mon.hp + amount)
-    return mon.hp - before
+    new_hp = min(max_hp, hp + amount)
+    return new_hp, new_hp - hp
 
 
 def primary_restore_half(battle_state: BattleState) -> None:
@@ -26,7 +26,7 @@ def primary_restore_half(battle_state: BattleState) -> None:
     if mon is None or mon.hp <= 0:
         return
     heal = max(1, mon.maxHP // 2)
-    restored = _apply_heal(mon, heal)
+    mon.hp, restored = _apply_heal(mon.hp, mon.maxHP, heal)
     battle_state.script_damage = -restored
 
 
@@ -41,11 +41,12 @@ def primary_rest(battle_state: BattleState) -> None:
     if mon is None or mon.hp <= 0:
         return
     # Insomnia/Vital Spirit prevent sleep -> Rest fails
-    if mon.ability in (Ability.INSOMNIA, Ability.VITAL_SPIRIT):
+    ability = mon.ability
+    if ability == Ability.INSOMNIA or ability == Ability.VITAL_SPIRIT:
         return
     # If already at full HP, Rest still sets sleep and cures status in-game; keep faithful heal-to-full
     heal = max(0, mon.maxHP - mon.hp)
-    restored = _apply_heal(mon, heal)
+    mon.hp, restored = _apply_heal(mon.hp, mon.maxHP, heal)
     # Cure all non-volatile major statuses and set sleep 2 turns
     mon.status1 = Status1.create_sleep(2)
     battle_state.script_damage = -restored
@@ -75,5 +76,5 @@ def primary_weather_heal(battle_state: BattleState) -> None:
             fraction_num, fraction_den = 1, 4
 
     heal = max(1, (mon.maxHP * fraction_num) // fraction_den)
-    restored = _apply_heal(mon, heal)
+    mon.hp, restored = _apply_heal(mon.hp, mon.maxHP, heal)
     battle_state.script_damage = -restored
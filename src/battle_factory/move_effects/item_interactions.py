@@ -21,7 +21,7 @@ def secondary_knock_off(battle_state: BattleState) -> None:
     if target.item == Item.NONE:
         return
     target.item = Item.NONE
-    side = target_id % 2
+    side = target_id & 1
     party_index = battle_state.active_party_index[target_id]
     if party_index is None or party_index < 0:
         party_index = 0
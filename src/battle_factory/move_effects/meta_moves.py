@@ -1,3 +1,6 @@
+from functools import partial
+from typing import Callable
+
 from src.battle_factory.enums import Move, Ability, Type
 from src.battle_factory.enums.move_effect import MoveEffect
 from src.battle_factory.schema.battle_state import BattleState
@@ -19,16 +22,54 @@ BATTLE_ENVIRONMENT_CAVE = 7
 BATTLE_ENVIRONMENT_BUILDING = 8
 BATTLE_ENVIRONMENT_PLAIN = 9
 
-
-def select_metronome_move(battle_state: BattleState) -> Move:
-    """Pick a random allowed move for Metronome using a Gen 3-like banlist.
-
-    Source:
-    - pokeemerald/src/battle_script_commands.c (Cmd_metronome, sMovesForbiddenToCopy)
-    - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectMetronome)
-    """
-    # Core forbidden set based on sMovesForbiddenToCopy up to METRONOME_FORBIDDEN_END
-    forbidden_moves: set[Move] = {
+# Environment-indexed tables (BATTLE_ENVIRONMENT_* are contiguous from 0)
+
+# sNaturePowerMoves[]
+_NATURE_POWER_MOVES: tuple[Move, ...] = (
+    Move.STUN_SPORE,  # GRASS
+    Move.RAZOR_LEAF,  # LONG_GRASS
+    Move.EARTHQUAKE,  # SAND
+    Move.HYDRO_PUMP,  # UNDERWATER
+    Move.SURF,  # WATER
+    Move.BUBBLE_BEAM,  # POND
+    Move.ROCK_SLIDE,  # MOUNTAIN
+    Move.SHADOW_BALL,  # CAVE
+    Move.SWIFT,  # BUILDING
+    Move.SWIFT,  # PLAIN
+)
+
+# sEnvironmentToType[]
+_ENVIRONMENT_TYPES: tuple[Type, ...] = (
+    Type.GRASS,  # GRASS
+    Type.GRASS,  # LONG_GRASS
+    Type.GROUND,  # SAND
+    Type.WATER,  # UNDERWATER
+    Type.WATER,  # WATER
+    Type.WATER,  # POND
+    Type.ROCK,  # MOUNTAIN
+    Type.ROCK,  # CAVE
+    Type.NORMAL,  # BUILDING
+    Type.NORMAL,  # PLAIN
+)
+
+# Cmd_getsecretpowereffect switch table
+_SECRET_POWER_EFFECTS: tuple[Callable[[BattleState], object], ...] = (
+    status_effects.secondary_poison,  # GRASS
+    status_effects.primary_sleep,  # LONG_GRASS
+    partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ACC, stages=1),  # SAND
+    partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_DEF, stages=1),  # UNDERWATER
+    partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_ATK, stages=1),  # WATER
+    partial(stat_changes.lower_stat_target, stat_index=stat_changes.STAT_SPEED, stages=1),  # POND
+    status_effects.primary_confuse,  # MOUNTAIN
+    status_effects.secondary_flinch,  # CAVE
+    status_effects.secondary_paralysis,  # BUILDING
+    status_effects.secondary_paralysis,  # PLAIN
+)
+
+
+# Core forbidden set based on sMovesForbiddenToCopy up to METRONOME_FORBIDDEN_END
+_METRONOME_FORBIDDEN_MOVES: frozenset[Move] = frozenset(
+    {
         Move.METRONOME,
         Move.STRUGGLE,
         Move.SKETCH,
@@ -49,24 +90,41 @@ def select_metronome_move(battle_state: BattleState) -> Move:
         Move.FOCUS_PUNCH,
         Move.NONE,
     }
+)
+
 
+# Base PP per move; Metronome/Assist only need this one field from the move data
+_MOVE_PP: dict[Move, int] = {move: get_move_data(move).pp for move in Move}
+
+
+def _build_metronome_candidates() -> tuple[Move, ...]:
     candidates: list[Move] = []
     for move in Move:
-        if move in forbidden_moves:
-            continue
-        md = get_move_data(move)
-        if md is None:
+        if move in _METRONOME_FORBIDDEN_MOVES:
             continue
         # Exclude placeholder/unused moves with 0 PP in our data
-        if md.pp <= 0:
+        if _MOVE_PP[move] <= 0:
             continue
         candidates.append(move)
+    return tuple(candidates)
 
-    if not candidates:
+
+# Metronome's pool only depends on static move data, so build it once at import
+_METRONOME_CANDIDATES: tuple[Move, ...] = _build_metronome_candidates()
+
+
+def select_metronome_move(battle_state: BattleState) -> Move:
+    """Pick a random allowed move for Metronome using a Gen 3-like banlist.
+
+    Source:
+    - pokeemerald/src/battle_script_commands.c (Cmd_metronome, sMovesForbiddenToCopy)
+    - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectMetronome)
+    """
+    if not _METRONOME_CANDIDATES:
         return Move.NONE
 
-    idx = rng.choice_index(battle_state, len(candidates))
-    return candidates[idx]
+    idx = rng.choice_index(battle_state, len(_METRONOME_CANDIDATES))
+    return _METRONOME_CANDIDATES[idx]
 
 
 def select_nature_power_move(battle_state: BattleState) -> Move:
@@ -77,19 +135,9 @@ def select_nature_power_move(battle_state: BattleState) -> Move:
     - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectNaturePower)
     """
     env = battle_state.battle_environment
-    mapping = {
-        BATTLE_ENVIRONMENT_GRASS: Move.STUN_SPORE,
-        BATTLE_ENVIRONMENT_LONG_GRASS: Move.RAZOR_LEAF,
-        BATTLE_ENVIRONMENT_SAND: Move.EARTHQUAKE,
-        BATTLE_ENVIRONMENT_UNDERWATER: Move.HYDRO_PUMP,
-        BATTLE_ENVIRONMENT_WATER: Move.SURF,
-        BATTLE_ENVIRONMENT_POND: Move.BUBBLE_BEAM,
-        BATTLE_ENVIRONMENT_MOUNTAIN: Move.ROCK_SLIDE,
-        BATTLE_ENVIRONMENT_CAVE: Move.SHADOW_BALL,
-        BATTLE_ENVIRONMENT_BUILDING: Move.SWIFT,
-        BATTLE_ENVIRONMENT_PLAIN: Move.SWIFT,
-    }
-    return mapping.get(env, Move.SWIFT)
+    if 0 <= env < len(_NATURE_POWER_MOVES):
+        return _NATURE_POWER_MOVES[env]
+    return Move.SWIFT
 
 
 def get_environment_type(battle_state: BattleState) -> Type:
@@ -100,34 +148,14 @@ def get_environment_type(battle_state: BattleState) -> Type:
     - Used by Camouflage and messaging in the original scripts
     """
     env = battle_state.battle_environment
-    env_to_type = {
-        BATTLE_ENVIRONMENT_GRASS: Type.GRASS,
-        BATTLE_ENVIRONMENT_LONG_GRASS: Type.GRASS,
-        BATTLE_ENVIRONMENT_SAND: Type.GROUND,
-        BATTLE_ENVIRONMENT_UNDERWATER: Type.WATER,
-        BATTLE_ENVIRONMENT_WATER: Type.WATER,
-        BATTLE_ENVIRONMENT_POND: Type.WATER,
-        BATTLE_ENVIRONMENT_MOUNTAIN: Type.ROCK,
-        BATTLE_ENVIRONMENT_CAVE: Type.ROCK,
-        BATTLE_ENVIRONMENT_BUILDING: Type.NORMAL,
-        BATTLE_ENVIRONMENT_PLAIN: Type.NORMAL,
-    }
-    return env_to_type.get(env, Type.NORMAL)
+    if 0 <= env < len(_ENVIRONMENT_TYPES):
+        return _ENVIRONMENT_TYPES[env]
+    return Type.NORMAL
 
 
-def select_assist_move(battle_state: BattleState, attacker_id: int) -> Move:
-    """Select an Assist move from the user's party with Gen 3 exclusions.
-
-    Source:
-    - pokeemerald/src/battle_script_commands.c (Cmd_assistattackselect, sMovesForbiddenToCopy)
-    - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectAssist)
-    """
-    is_player = (attacker_id % 2) == 0
-    party = battle_state.player_party if is_player else battle_state.opponent_party
-    user_party_slot = battle_state.active_party_index[attacker_id]
-
-    # Invalid for Assist (sleep talk/assist filters) and explicit banlist until ASSIST_FORBIDDEN_END
-    forbidden_moves: set[Move] = {
+# Invalid for Assist (sleep talk/assist filters) and explicit banlist until ASSIST_FORBIDDEN_END
+_ASSIST_FORBIDDEN_MOVES: frozenset[Move] = frozenset(
+    {
         Move.NONE,
         Move.METRONOME,
         Move.STRUGGLE,
@@ -149,25 +177,29 @@ def select_assist_move(battle_state: BattleState, attacker_id: int) -> Move:
         Move.FOCUS_PUNCH,
         Move.ASSIST,
     }
+)
 
-    candidates: list[Move] = []
-    for slot, mon in enumerate(party):
-        if mon is None:
-            continue
-        if slot == user_party_slot:
-            continue
-        if mon.hp <= 0:
-            continue
-        for mv in mon.moves:
-            if mv in forbidden_moves:
-                continue
-            md = get_move_data(mv)
-            if md is None:
-                continue
-            # Disallow moves with 0 PP base or empty move
-            if md.pp <= 0:
-                continue
-            candidates.append(mv)
+
+def select_assist_move(battle_state: BattleState, attacker_id: int) -> Move:
+    """Select an Assist move from the user's party with Gen 3 exclusions.
+
+    Source:
+    - pokeemerald/src/battle_script_commands.c (Cmd_assistattackselect, sMovesForbiddenToCopy)
+    - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectAssist)
+    """
+    party = battle_state.player_party if (attacker_id & 1) == 0 else battle_state.opponent_party
+    user_party_slot = battle_state.active_party_index[attacker_id]
+
+    # Healthy party members other than the user; disallow banned moves and moves with 0 base PP
+    forbidden = _ASSIST_FORBIDDEN_MOVES
+    move_pp = _MOVE_PP
+    candidates: list[Move] = [
+        mv
+        for slot, mon in enumerate(party)
+        if mon is not None and slot != user_party_slot and mon.hp > 0
+        for mv in mon.moves
+        if mv not in forbidden and move_pp.get(mv, 0) > 0
+    ]
 
     if not candidates:
         return Move.NONE
@@ -251,25 +283,10 @@ def apply_secret_power_secondary(battle_state: BattleState) -> None:
     - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectSecretPower)
     """
     env = battle_state.battle_environment
-    # Map to effect handlers
-    if env == BATTLE_ENVIRONMENT_GRASS:
-        status_effects.secondary_poison(battle_state)
-    elif env == BATTLE_ENVIRONMENT_LONG_GRASS:
-        status_effects.primary_sleep(battle_state)
-    elif env == BATTLE_ENVIRONMENT_SAND:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ACC, 1)
-    elif env == BATTLE_ENVIRONMENT_UNDERWATER:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_DEF, 1)
-    elif env == BATTLE_ENVIRONMENT_WATER:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_ATK, 1)
-    elif env == BATTLE_ENVIRONMENT_POND:
-        stat_changes.lower_stat_target(battle_state, stat_changes.STAT_SPEED, 1)
-    elif env == BATTLE_ENVIRONMENT_MOUNTAIN:
-        status_effects.primary_confuse(battle_state)
-    elif env == BATTLE_ENVIRONMENT_CAVE:
-        status_effects.secondary_flinch(battle_state)
+    if 0 <= env < len(_SECRET_POWER_EFFECTS):
+        _SECRET_POWER_EFFECTS[env](battle_state)
     else:
-        # Default: Paralysis (BUILDING/PLAIN/unknown)
+        # Default: Paralysis (unknown environment)
         status_effects.secondary_paralysis(battle_state)
 
 
@@ -283,8 +300,7 @@ def perform_beat_up(battle_state: BattleState) -> None:
     attacker_id = battle_state.battler_attacker
     target_id = battle_state.battler_target
 
-    is_player = (attacker_id % 2) == 0
-    party = battle_state.player_party if is_player else battle_state.opponent_party
+    party = battle_state.player_party if (attacker_id & 1) == 0 else battle_state.opponent_party
 
     total = 0
     md = get_move_data(battle_state.current_move)
@@ -1,12 +1,24 @@
+from bisect import bisect_right
+from functools import partial
+from typing import Callable
+
 from src.battle_factory.schema.battle_state import BattleState
 from src.battle_factory.schema.battle_pokemon import BattlePokemon
 from src.battle_factory.damage_calculator import DamageCalculator
 from src.battle_factory.data.moves import get_move_type, get_move_data
-from src.battle_factory.type_effectiveness import TypeEffectiveness
+from src.battle_factory.type_effectiveness import TYPE_EFFECTIVENESS_TABLE
 from src.battle_factory.enums import Ability
 from src.battle_factory.enums.move_effect import MoveEffect
 from src.battle_factory.move_effects import status_effects
 from src.battle_factory.utils import rng
+from src.battle_factory.utils.rng import LCG_MULTIPLIER, LCG_INCREMENT
+
+
+# Abilities whose immunity handling inside calculate_base_damage changes battle state
+_BASE_DAMAGE_SIDE_EFFECT_ABILITIES = frozenset({Ability.FLASH_FIRE, Ability.VOLT_ABSORB, Ability.WATER_ABSORB})
+
+# 0..65535 roll thresholds for 37.5%, 75.0%, 87.5% of 65536
+_HIT_THRESHOLDS = (24576, 49152, 57344)
 
 
 def _roll_hit_count(battle_state: BattleState) -> int:
@@ -18,40 +30,57 @@ def _roll_hit_count(battle_state: BattleState) -> int:
     Source: pokeemerald/src/battle_script_commands.c (multi-hit logic)
     """
     roll = rng.rand16(battle_state)  # 0..65535
-    # Thresholds for 37.5%, 75.0%, 87.5% of 65536
-    t2 = (65536 * 375) // 1000  # 24576
-    t3 = (65536 * 750) // 1000  # 49152
-    t4 = (65536 * 875) // 1000  # 57344
-    if roll < t2:
-        return 2
-    if roll < t3:
-        return 3
-    if roll < t4:
-        return 4
-    return 5
-
+    return bisect_right(_HIT_THRESHOLDS, roll) + 2
 
-def perform_multi_hit(battle_state: BattleState, fixed_hits: int | None = None) -> int:
-    """Apply EFFECT_MULTI_HIT damage 2-5 times (or fixed_hits when specified).
 
-    Mirrors Emerald's per-hit damage application: base calc → type → STAB → 85-100% roll
-    repeated per hit, accumulating total. Accuracy is handled by the script earlier.
+def _perform_hits(
+    battle_state: BattleState,
+    attacker: BattlePokemon,
+    defender: BattlePokemon,
+    powers: tuple[int, ...],
+    after_hit: Callable[[BattleState], object] | None = None,
+) -> int:
+    """Shared per-hit loop for multi-hit moves; one hit per entry in powers.
 
-    Source: data/battle_scripts_1.s (BattleScript_EffectMultiHit) and
-            pokeemerald/src/battle_script_commands.c
+    Each entry is the power_override for that hit (0 = move's own power). Mirrors Emerald's
+    per-hit damage application: base calc → type → STAB → 85-100% roll, accumulating total.
+    after_hit, if given, runs after each hit's HP update (e.g. Twineedle's poison roll).
     """
-    attacker: BattlePokemon | None = battle_state.battlers[battle_state.battler_attacker]
-    defender: BattlePokemon | None = battle_state.battlers[battle_state.battler_target]
-    if attacker is None or defender is None:
-        return 0
-
-    hits = fixed_hits if fixed_hits is not None else _roll_hit_count(battle_state)
-
     total_damage = 0
     calculator = DamageCalculator(battle_state)
-    move_type = get_move_type(battle_state.current_move)
-
-    for _ in range(hits):
+    move = battle_state.current_move
+    move_type = get_move_type(move)
+    # Loop invariants: battlers, field state and STAB can't change between hits
+    attacker_id = battle_state.battler_attacker
+    defender_id = battle_state.battler_target
+    side_status = battle_state.side_statuses[defender_id % 2]
+    weather = battle_state.weather
+    stab_mul = 15 if move_type in attacker.types else 10
+    # Defender types don't change between hits, so resolve both lookups once.
+    # A mono-type defender's second multiplier is x1.0 (exact).
+    type_row = TYPE_EFFECTIVENESS_TABLE[move_type]
+    type1, type2 = defender.types
+    eff1 = type_row[type1]
+    eff2 = type_row[type2] if type2 is not None and type2 != type1 else 10
+    # Nothing below touches the RNG except the damage roll, so keep the seed in a
+    # local and store it back once after the loop
+    seed = battle_state.rng_seed
+
+    # Type immunity zeroes every hit before the minimum-1 clamp, so each hit deals exactly 1
+    # and base damage is irrelevant. Only skip the base calc when it has no side effects for
+    # this defender (absorb abilities) and nothing runs between hits; rolls still advance the RNG.
+    if (eff1 == 0 or eff2 == 0) and after_hit is None and defender.ability not in _BASE_DAMAGE_SIDE_EFFECT_ABILITIES:
+        hits = min(len(powers), defender.hp) if defender.hp > 0 else 0
+        for _ in range(hits):
+            seed = (seed * LCG_MULTIPLIER + LCG_INCREMENT) & 0xFFFFFFFF
+        battle_state.rng_seed = seed
+        if hits:
+            defender.hp -= hits
+            battle_state.script_damage = 1
+        battle_state.battle_move_damage = hits
+        return hits
+
+    for power_override in powers:
         if defender.hp <= 0:
             break
 
@@ -59,101 +88,90 @@ def perform_multi_hit(battle_state: BattleState, fixed_hits: int | None = None)
         base = calculator.calculate_base_damage(
             attacker=attacker,
             defender=defender,
-            move=battle_state.current_move,
-            side_status=battle_state.side_statuses[battle_state.battler_target % 2],
-            power_override=0,
+            move=move,
+            side_status=side_status,
+            power_override=power_override,
             type_override=None,
-            attacker_id=battle_state.battler_attacker,
-            defender_id=battle_state.battler_target,
+            attacker_id=attacker_id,
+            defender_id=defender_id,
             critical_multiplier=1,
-            weather=battle_state.weather,
+            weather=weather,
         )
 
-        # Type effectiveness per defending type sequentially
-        eff1 = TypeEffectiveness.get_effectiveness(move_type, defender.types[0])
-        dmg = (base * eff1) // 10
-        if defender.types[1] is not None and defender.types[1] != defender.types[0]:
-            eff2 = TypeEffectiveness.get_effectiveness(move_type, defender.types[1])
-            dmg = (dmg * eff2) // 10
-
-        # STAB
-        if move_type in attacker.types:
-            dmg = (dmg * 15) // 10
+        # Type effectiveness per defending type, then STAB, flooring after each step as
+        # ModulateDmgByType does (x1.0 steps are exact, so apply unconditionally)
+        dmg = (((((base * eff1) // 10) * eff2) // 10) * stab_mul) // 10
 
-        # Random factor 85-100%
-        rand16 = rng.rand16(battle_state)
-        roll = 85 + (rand16 % 16)
+        # Random factor 85-100% (inlined rng.rand16)
+        seed = (seed * LCG_MULTIPLIER + LCG_INCREMENT) & 0xFFFFFFFF
+        roll = 85 + ((seed >> 16) & 15)
         dmg = (dmg * roll) // 100
 
         if dmg < 1:
             dmg = 1
 
-        # Apply to defender
-        defender.hp = max(0, defender.hp - dmg)
+        # Apply to defender: one read and one store of the HP field
+        hp = defender.hp - dmg
+        defender.hp = hp if hp > 0 else 0
         total_damage += dmg
-        battle_state.script_damage = dmg
 
+        if after_hit is not None:
+            # Per-hit effects see the live RNG state and this hit's damage
+            battle_state.rng_seed = seed
+            battle_state.script_damage = dmg
+            after_hit(battle_state)
+            seed = battle_state.rng_seed
+
+    battle_state.rng_seed = seed
+    # Only the last hit's damage is reported; every hit deals at least 1, so a
+    # non-zero total means at least one hit landed
+    if total_damage:
+        battle_state.script_damage = dmg
     # Set final damage for reporting
     battle_state.battle_move_damage = total_damage
     return total_damage
 
 
-def perform_triple_kick(battle_state: BattleState) -> int:
-    """Triple Kick (Gen 3): 3 hits with power 10, 20, 30.
+def perform_multi_hit(battle_state: BattleState, fixed_hits: int | None = None) -> int:
+    """Apply EFFECT_MULTI_HIT damage 2-5 times (or fixed_hits when specified).
 
-    Source: BattleScript_EffectTripleKick in data/battle_scripts_1.s and
-            related handling in battle_script_commands.c
+    Mirrors Emerald's per-hit damage application: base calc → type → STAB → 85-100% roll
+    repeated per hit, accumulating total. Accuracy is handled by the script earlier.
+
+    Source: data/battle_scripts_1.s (BattleScript_EffectMultiHit) and
+            pokeemerald/src/battle_script_commands.c
     """
     attacker: BattlePokemon | None = battle_state.battlers[battle_state.battler_attacker]
     defender: BattlePokemon | None = battle_state.battlers[battle_state.battler_target]
     if attacker is None or defender is None:
         return 0
 
-    total_damage = 0
-    calculator = DamageCalculator(battle_state)
-    move_type = get_move_type(battle_state.current_move)
+    hits = fixed_hits if fixed_hits is not None else _roll_hit_count(battle_state)
+    return _perform_hits(battle_state, attacker, defender, (0,) * hits)
 
-    for idx in range(3):
-        if defender.hp <= 0:
-            break
 
-        power_override = 10 * (idx + 1)
+# Triple Kick per-hit power: 10, 20, 30
+_TRIPLE_KICK_POWERS = (10, 20, 30)
 
-        base = calculator.calculate_base_damage(
-            attacker=attacker,
-            defender=defender,
-            move=battle_state.current_move,
-            side_status=battle_state.side_statuses[battle_state.battler_target % 2],
-            power_override=power_override,
-            type_override=None,
-            attacker_id=battle_state.battler_attacker,
-            defender_id=battle_state.battler_target,
-            critical_multiplier=1,
-            weather=battle_state.weather,
-        )
-
-        eff1 = TypeEffectiveness.get_effectiveness(move_type, defender.types[0])
-        dmg = (base * eff1) // 10
-        if defender.types[1] is not None and defender.types[1] != defender.types[0]:
-            eff2 = TypeEffectiveness.get_effectiveness(move_type, defender.types[1])
-            dmg = (dmg * eff2) // 10
 
-        if move_type in attacker.types:
-            dmg = (dmg * 15) // 10
+def perform_triple_kick(battle_state: BattleState) -> int:
+    """Triple Kick (Gen 3): 3 hits with power 10, 20, 30.
 
-        rand16 = rng.rand16(battle_state)
-        roll = 85 + (rand16 % 16)
-        dmg = (dmg * roll) // 100
+    Source: BattleScript_EffectTripleKick in data/battle_scripts_1.s and
+            related handling in battle_script_commands.c
+    """
+    attacker: BattlePokemon | None = battle_state.battlers[battle_state.battler_attacker]
+    defender: BattlePokemon | None = battle_state.battlers[battle_state.battler_target]
+    if attacker is None or defender is None:
+        return 0
 
-        if dmg < 1:
-            dmg = 1
+    return _perform_hits(battle_state, attacker, defender, _TRIPLE_KICK_POWERS)
 
-        defender.hp = max(0, defender.hp - dmg)
-        total_damage += dmg
-        battle_state.script_damage = dmg
 
-    battle_state.battle_move_damage = total_damage
-    return total_damage
+def _twineedle_poison_roll(battle_state: BattleState, threshold: int) -> None:
+    # Per-hit poison chance; threshold is chance scaled to the 0..65535 roll
+    if rng.rand16(battle_state) < threshold:
+        status_effects.secondary_poison(battle_state)
 
 
 def perform_twineedle(battle_state: BattleState) -> int:
@@ -167,56 +185,11 @@ def perform_twineedle(battle_state: BattleState) -> int:
     if attacker is None or defender is None:
         return 0
 
-    total_damage = 0
-    calculator = DamageCalculator(battle_state)
-    move_type = get_move_type(battle_state.current_move)
-    md = get_move_data(battle_state.current_move)
-    chance = md.secondaryEffectChance if md and md.secondaryEffectChance else 0
-
-    for _ in range(2):
-        if defender.hp <= 0:
-            break
-
-        base = calculator.calculate_base_damage(
-            attacker=attacker,
-            defender=defender,
-            move=battle_state.current_move,
-            side_status=battle_state.side_statuses[battle_state.battler_target % 2],
-            power_override=0,
-            type_override=None,
-            attacker_id=battle_state.battler_attacker,
-            defender_id=battle_state.battler_target,
-            critical_multiplier=1,
-            weather=battle_state.weather,
-        )
-
-        eff1 = TypeEffectiveness.get_effectiveness(move_type, defender.types[0])
-        dmg = (base * eff1) // 10
-        if defender.types[1] is not None and defender.types[1] != defender.types[0]:
-            eff2 = TypeEffectiveness.get_effectiveness(move_type, defender.types[1])
-            dmg = (dmg * eff2) // 10
-
-        if move_type in attacker.types:
-            dmg = (dmg * 15) // 10
-
-        rand16 = rng.rand16(battle_state)
-        roll = 85 + (rand16 % 16)
-        dmg = (dmg * roll) // 100
-
-        if dmg < 1:
-            dmg = 1
-
-        defender.hp = max(0, defender.hp - dmg)
-        total_damage += dmg
-        battle_state.script_damage = dmg
-
-        # Per-hit poison chance
-        if chance > 0 and defender.ability != Ability.SHIELD_DUST:
-            # roll percent
-            r = rng.rand16(battle_state)
-            threshold = (chance * 0xFFFF) // 100
-            if r < threshold:
-                status_effects.secondary_poison(battle_state)
-
-    battle_state.battle_move_damage = total_damage
-    return total_damage
+    # get_move_data always returns an entry (Move.NONE's for unknown moves)
+    chance = get_move_data(battle_state.current_move).secondaryEffectChance
+    # Chance and Shield Dust can't change between hits, so decide once whether to roll at all
+    if chance > 0 and defender.ability != Ability.SHIELD_DUST:
+        after_hit = partial(_twineedle_poison_roll, threshold=(chance * 0xFFFF) // 100)
+    else:
+        after_hit = None
+    return _perform_hits(battle_state, attacker, defender, (0, 0), after_hit=after_hit)
@@ -3,6 +3,12 @@ from src.battle_factory.enums import Ability, Move, Type
 from src.battle_factory.utils import rng
 
 
+def _fail(battle_state: BattleState) -> None:
+    """OHKO failed or missed: no damage."""
+    battle_state.battle_move_damage = 0
+    battle_state.script_damage = 0
+
+
 def apply_ohko(battle_state: BattleState) -> None:
     """Apply Gen 3 OHKO move behavior.
 
@@ -22,42 +28,29 @@ def apply_ohko(battle_state: BattleState) -> None:
     attacker = battle_state.battlers[attacker_id]
     target = battle_state.battlers[target_id]
     if attacker is None or target is None or target.hp <= 0:
-        battle_state.battle_move_damage = 0
-        battle_state.script_damage = 0
+        _fail(battle_state)
         return
 
     # Sturdy (Gen 3): complete immunity to OHKO moves
     if target.ability == Ability.STURDY:
-        battle_state.battle_move_damage = 0
-        battle_state.script_damage = 0
+        _fail(battle_state)
         return
 
     # Level check: OHKO fails if attacker level < target level
     if attacker.level < target.level:
-        battle_state.battle_move_damage = 0
-        battle_state.script_damage = 0
+        _fail(battle_state)
         return
 
     # Sheer Cold: fails against Ice-type targets in Gen 3
     if battle_state.current_move == Move.SHEER_COLD and (Type.ICE in target.types):
-        battle_state.battle_move_damage = 0
-        battle_state.script_damage = 0
+        _fail(battle_state)
         return
 
     # Accuracy: 30% + (attackerLevel - targetLevel), clamped 1..100
-    chance = 30 + (attacker.level - target.level)
-    if chance < 1:
-        chance = 1
-    if chance > 100:
-        chance = 100
+    chance = min(100, max(1, 30 + (attacker.level - target.level)))
 
     # Lock-On/Mind Reader: target remembers the battler with sure hit
-    sure_hit = False
-    try:
-        if battle_state.disable_structs[target_id].battlerWithSureHit == attacker_id:
-            sure_hit = True
-    except Exception:
-        pass
+    sure_hit = battle_state.disable_structs[target_id].battlerWithSureHit == attacker_id
 
     hit = True
     if not sure_hit:
@@ -73,5 +66,4 @@ def apply_ohko(battle_state: BattleState) -> None:
         battle_state.battle_move_damage = dmg
         battle_state.script_damage = dmg
     else:
-        battle_state.battle_move_damage = 0
-        battle_state.script_damage = 0
+        _fail(battle_state)
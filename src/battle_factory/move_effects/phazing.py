@@ -3,6 +3,9 @@ from src.battle_factory.schema.battle_state import BattleState, DisableStruct, P
 from src.battle_factory.utils import rng
 from src.battle_factory.constants import MOVE_RESULT_MISSED
 
+# Spikes damage denominator by layer count: 1/8, 1/6, 1/4 of max HP
+_SPIKES_DEN = (0, 8, 6, 4)
+
 
 def primary_phaze(battle_state: BattleState) -> None:
     """Roar/Whirlwind effect: force the target to switch if allowed.
@@ -48,17 +51,10 @@ def primary_phaze(battle_state: BattleState) -> None:
     # Exclude active party indices for this side (both positions in doubles)
     active_main = battle_state.active_party_index[0 if side_is_player else 1]
     active_partner = battle_state.active_party_index[2 if side_is_player else 3]
-    exclude = {idx for idx in (active_main, active_partner) if idx is not None and idx >= 0}
+    ex_a = active_main if active_main is not None and active_main >= 0 else -1
+    ex_b = active_partner if active_partner is not None and active_partner >= 0 else -1
 
-    candidates: list[int] = []
-    for slot, mon in enumerate(party):
-        if mon is None:
-            continue
-        if mon.hp <= 0:
-            continue
-        if slot in exclude:
-            continue
-        candidates.append(slot)
+    candidates = [slot for slot, mon in enumerate(party) if mon is not None and mon.hp > 0 and slot != ex_a and slot != ex_b]
 
     if not candidates:
         battle_state.move_result_flags |= MOVE_RESULT_MISSED
@@ -88,12 +84,7 @@ def primary_phaze(battle_state: BattleState) -> None:
         opponent_side = attacker_id % 2
         layers = battle_state.spikes_layers[opponent_side]
         if layers > 0:
-            if layers == 1:
-                dmg = max(1, new_mon.maxHP // 8)
-            elif layers == 2:
-                dmg = max(1, new_mon.maxHP // 6)
-            else:
-                dmg = max(1, new_mon.maxHP // 4)
+            dmg = max(1, new_mon.maxHP // _SPIKES_DEN[layers])
             new_mon.hp = max(0, new_mon.hp - dmg)
             battle_state.script_damage = dmg
             battle_state.battle_move_damage = dmg
@@ -1,6 +1,19 @@
 from src.battle_factory.schema.battle_state import BattleState
 
 
+def _reflect_damage(battle_state: BattleState, taken: int, target_id: int) -> None:
+    """Deal 2x the damage taken back to target_id (shared by Counter and Mirror Coat)."""
+    if taken <= 0:
+        return
+    target = battle_state.battlers[target_id]
+    if target is None:
+        return
+    dmg = taken * 2
+    target.hp = max(0, target.hp - dmg)
+    battle_state.script_damage = dmg
+    battle_state.battle_move_damage = dmg
+
+
 def primary_counter(battle_state: BattleState) -> None:
     """Apply Counter: reflect last physical damage taken to the recorded attacker for 2x.
 
@@ -8,16 +21,8 @@ def primary_counter(battle_state: BattleState) -> None:
     - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectCounter)
     - pokeemerald/src/battle_script_commands.c (Cmd_counterdamagecalculator)
     """
-    attacker_id = battle_state.battler_attacker
-    ps = battle_state.protect_structs[attacker_id]
-    if ps.physicalDmg > 0:
-        target_id = ps.physicalBattlerId
-        target = battle_state.battlers[target_id]
-        if target is not None:
-            dmg = ps.physicalDmg * 2
-            target.hp = max(0, target.hp - dmg)
-            battle_state.script_damage = dmg
-            battle_state.battle_move_damage = dmg
+    ps = battle_state.protect_structs[battle_state.battler_attacker]
+    _reflect_damage(battle_state, ps.physicalDmg, ps.physicalBattlerId)
 
 
 def primary_mirror_coat(battle_state: BattleState) -> None:
@@ -27,16 +32,8 @@ def primary_mirror_coat(battle_state: BattleState) -> None:
     - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectMirrorCoat)
     - pokeemerald/src/battle_script_commands.c (Cmd_mirrorcoatdamagecalculator)
     """
-    attacker_id = battle_state.battler_attacker
-    ps = battle_state.protect_structs[attacker_id]
-    if ps.specialDmg > 0:
-        target_id = ps.specialBattlerId
-        target = battle_state.battlers[target_id]
-        if target is not None:
-            dmg = ps.specialDmg * 2
-            target.hp = max(0, target.hp - dmg)
-            battle_state.script_damage = dmg
-            battle_state.battle_move_damage = dmg
+    ps = battle_state.protect_structs[battle_state.battler_attacker]
+    _reflect_damage(battle_state, ps.specialDmg, ps.specialBattlerId)
 
 
 def primary_magic_coat(battle_state: BattleState) -> None:
@@ -65,7 +62,11 @@ def primary_bide(battle_state: BattleState) -> None:
     """Apply Bide setup/release behavior.
 
     First use: start 2-turn counter and accumulate damage while active (handled elsewhere).
-    On release: deal 2x accumulated damage to the recorded target, then reset.
+    On release: deal 2x accumulated damage to the recorded target, then reset. If nothing
+    was stored, the release fails and only the Bide state is cleared.
+
+    bideTimer is decremented at end of turn, so the use after it runs out is the release
+    turn; bideTimerStartValue marks that a Bide is in progress.
 
     Source:
     - pokeemerald/data/battle_scripts_1.s (BattleScript_EffectBide)
@@ -73,20 +74,25 @@ def primary_bide(battle_state: BattleState) -> None:
     """
     user = battle_state.battler_attacker
     ds = battle_state.disable_structs[user]
-    if ds.bideTimer == 0:
+    if ds.bideTimer > 0:
+        # Still storing energy
+        return
+    if ds.bideTimerStartValue == 0:
         battle_state.bide_damage[user] = 0
         battle_state.bide_target[user] = 0
         ds.bideTimer = 2
         ds.bideTimerStartValue = 2
         return
-    else:
-        if ds.bideTimer == 0:
-            dmg = max(1, battle_state.bide_damage[user] * 2)
-            target = battle_state.battlers[battle_state.bide_target[user]]
-            if target is not None:
-                target.hp = max(0, target.hp - dmg)
-                battle_state.script_damage = dmg
-                battle_state.battle_move_damage = dmg
-            battle_state.bide_damage[user] = 0
-            battle_state.bide_target[user] = 0
-            return
+
+    # Release; with no stored damage the move fails (BattleScript_BideNoEnergyToAttack)
+    stored = battle_state.bide_damage[user]
+    if stored > 0:
+        dmg = stored * 2
+        target = battle_state.battlers[battle_state.bide_target[user]]
+        if target is not None:
+            target.hp = max(0, target.hp - dmg)
+            battle_state.script_damage = dmg
+            battle_state.battle_move_damage = dmg
+    battle_state.bide_damage[user] = 0
+    battle_state.bide_target[user] = 0
+    ds.bideTimerStartValue = 0
@@ -28,11 +28,9 @@ def apply_drain_heal(battle_state: BattleState, fraction_num: int, fraction_den:
     if heal <= 0:
         return
 
-    if target.ability == Ability.LIQUID_OOZE:
-        # Damage the attacker instead of healing
-        attacker.hp = max(0, attacker.hp - heal)
-    else:
-        attacker.hp = min(attacker.maxHP, attacker.hp + heal)
+    # Liquid Ooze damages the attacker instead of healing; one clamp covers both
+    hp = attacker.hp - heal if target.ability == Ability.LIQUID_OOZE else attacker.hp + heal
+    attacker.hp = 0 if hp < 0 else attacker.maxHP if hp > attacker.maxHP else hp
 
 
 def apply_recoil(attacker_hp: int, recoil_num: int, recoil_den: int, damage_dealt: int) -> int:
@@ -50,15 +48,23 @@ def apply_recoil(attacker_hp: int, recoil_num: int, recoil_den: int, damage_deal
     return max(0, attacker_hp - recoil)
 
 
+# Per-move recoil as (numerator, denominator) of damage dealt
+_RECOIL_RATIO: dict[Move, tuple[int, int]] = {
+    Move.TAKE_DOWN: (1, 4),
+    Move.SUBMISSION: (1, 4),
+    Move.DOUBLE_EDGE: (1, 3),
+    Move.VOLT_TACKLE: (1, 3),
+    Move.STRUGGLE: (1, 3),
+}
+# Fallback for unspecified RECOIL family members
+_DEFAULT_RECOIL_RATIO = (1, 3)
+
+
 def apply_recoil_for_move(attacker_hp: int, move: Move, damage_dealt: int) -> int:
     """Apply exact recoil ratios per move for Gen 3.
 
     - Take Down, Submission: 1/4 recoil
     - Double-Edge, Volt Tackle, Struggle: 1/3 recoil
     """
-    if move in (Move.TAKE_DOWN, Move.SUBMISSION):
-        return apply_recoil(attacker_hp, 1, 4, damage_dealt)
-    if move in (Move.DOUBLE_EDGE, Move.VOLT_TACKLE, Move.STRUGGLE):
-        return apply_recoil(attacker_hp, 1, 3, damage_dealt)
-    # Fallback to 1/3 for unspecified RECOIL family members
-    return apply_recoil(attacker_hp, 1, 3, damage_dealt)
+    num, den = _RECOIL_RATIO.get(move, _DEFAULT_RECOIL_RATIO)
+    return apply_recoil(attacker_hp, num, den, damage_dealt)
@@ -1,6 +1,7 @@
 from src.battle_factory.enums import Status2
 from src.battle_factory.schema.battle_state import BattleState
 from src.battle_factory.constants import MOVE_RESULT_MISSED
+from src.battle_factory.move_effects.field_effects import SIDE_STATUS_SPIKES
 
 
 
@@ -15,12 +16,14 @@ def secondary_rapid_spin(battle_state: BattleState) -> None:
         return
     mon = battle_state.battlers[user]
     if mon is not None:
-        mon.status2 = mon.status2.remove_wrapped()
-        mon.status2 &= ~Status2.ESCAPE_PREVENTION
+        mon.status2 = mon.status2.remove_wrapped() & ~Status2.ESCAPE_PREVENTION
     ss = battle_state.special_statuses[user]
     ss.physicalBattlerId = 0
     ss.specialDmg = 0
-    side = user % 2
+    side = user & 1
+    # Cmd_rapidspinfree clears SIDE_STATUS_SPIKES together with the layer count, so
+    # primary_spikes sets the bit again on the next first layer
+    battle_state.side_statuses[side] &= ~SIDE_STATUS_SPIKES
     battle_state.spikes_layers[side] = 0
 
 
@@ -33,7 +36,7 @@ def secondary_brick_break(battle_state: BattleState) -> None:
     """
     if (battle_state.move_result_flags & MOVE_RESULT_MISSED) != 0:
         return
-    side = battle_state.battler_target % 2
+    side = battle_state.battler_target & 1
     if battle_state.reflect_timers[side] > 0:
         battle_state.reflect_timers[side] = 0
         battle_state.side_statuses[side] &= ~(1 << 0)
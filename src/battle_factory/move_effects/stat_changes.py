@@ -12,11 +12,21 @@ from src.battle_factory.constants import (
     MAX_STAT_STAGE,
     MIN_STAT_STAGE,
     DEFAULT_STAT_STAGE,
+    NUM_BATTLE_STATS,
 )
 
 # Side status bits
 SIDE_STATUS_MIST = 1 << 8
 
+# Abilities that block lowering each stat, indexed by stat: Clear Body/White Smoke block all
+# reductions, Hyper Cutter also blocks Attack and Keen Eye also blocks Accuracy
+_STAT_LOWER_BLOCKING_ABILITIES: tuple[frozenset[Ability], ...] = tuple(
+    frozenset({Ability.CLEAR_BODY, Ability.WHITE_SMOKE})
+    | ({Ability.HYPER_CUTTER} if stat_index == STAT_ATK else set())
+    | ({Ability.KEEN_EYE} if stat_index == STAT_ACC else set())
+    for stat_index in range(NUM_BATTLE_STATS)
+)
+
 
 def _can_lower_stat(battle_state: BattleState, target_id: int, stat_index: int) -> bool:
     """Check if a stat can be lowered based on Gen 3 protections.
@@ -32,23 +42,12 @@ def _can_lower_stat(battle_state: BattleState, target_id: int, stat_index: int)
         return False
 
     # Mist prevents stat reduction on the protected side
-    side = target_id % 2
+    side = target_id & 1
     if battle_state.side_statuses[side] & SIDE_STATUS_MIST:
         return False
 
-    # Clear Body / White Smoke prevent all stat reductions
-    if target.ability in (Ability.CLEAR_BODY, Ability.WHITE_SMOKE):
-        return False
-
-    # Hyper Cutter prevents Attack drops
-    if stat_index == STAT_ATK and target.ability == Ability.HYPER_CUTTER:
-        return False
-
-    # Keen Eye prevents Accuracy drops
-    if stat_index == STAT_ACC and target.ability == Ability.KEEN_EYE:
-        return False
-
-    return True
+    # Clear Body / White Smoke, Hyper Cutter (Atk) and Keen Eye (Accuracy)
+    return target.ability not in _STAT_LOWER_BLOCKING_ABILITIES[stat_index]
 
 
 def change_stage(mon: BattlePokemon, stat_index: int, delta: int) -> None:
@@ -56,9 +55,8 @@ def change_stage(mon: BattlePokemon, stat_index: int, delta: int) -> None:
 
     Stages are clamped within MIN_STAT_STAGE .. MAX_STAT_STAGE.
     """
-    current = mon.statStages[stat_index]
-    new_stage = max(MIN_STAT_STAGE, min(MAX_STAT_STAGE, current + delta))
-    mon.statStages[stat_index] = new_stage
+    stage = mon.statStages[stat_index] + delta
+    mon.statStages[stat_index] = MIN_STAT_STAGE if stage < MIN_STAT_STAGE else MAX_STAT_STAGE if stage > MAX_STAT_STAGE else stage
 
 
 def raise_stat_user(battle_state: BattleState, stat_index: int, stages: int = 1) -> None:
@@ -1,11 +1,11 @@
 from src.battle_factory.enums import Type, Ability
 from src.battle_factory.enums.status import Status1, Status2
 from src.battle_factory.schema.battle_state import BattleState
+from src.battle_factory.schema.battle_pokemon import BattlePokemon
 from src.battle_factory.data.moves import get_move_type
 from src.battle_factory.enums.move import Move
 from src.battle_factory.move_effects import stat_changes
 from src.battle_factory.damage_calculator import DamageCalculator
-from src.battle_factory.data.moves import get_move_type
 from src.battle_factory.utils import rng
 
 # Side status bitmasks from include/constants/battle.h
@@ -13,58 +13,84 @@ SIDE_STATUS_REFLECT = 1 << 0
 SIDE_STATUS_LIGHTSCREEN = 1 << 1
 SIDE_STATUS_SAFEGUARD = 1 << 5
 
+# Major status values are constant, so build them once rather than per application
+_POISON = Status1.create_poison()
+_TOXIC = Status1.create_toxic(counter=1)
+_BURN = Status1.create_burn()
+_PARALYSIS = Status1.create_paralysis()
+_FREEZE = Status1.create_freeze()
+
 
 def _is_safeguarded(battle_state: BattleState, target_id: int) -> bool:
     """Return True if the target's side is protected by Safeguard."""
-    side = target_id % 2
+    side = target_id & 1
     return (battle_state.side_statuses[side] & SIDE_STATUS_SAFEGUARD) != 0
 
 
-def _can_apply_major_status(battle_state: BattleState, target_id: int) -> bool:
-    """Check if a major status can be applied to target in Gen 3.
+def _major_status_target(battle_state: BattleState, target_id: int) -> BattlePokemon | None:
+    """Return the target if a major status can be applied to it in Gen 3, else None.
 
-    Enforces existing status, Substitute, and Safeguard checks.
+    Enforces existing status, Substitute, and Safeguard checks. Returning the battler lets
+    callers apply the status without indexing battlers again.
     """
     target = battle_state.battlers[target_id]
     if target is None:
-        return False
+        return None
     # Already has a major status
     if target.status1.has_major_status():
-        return False
+        return None
     # Substitute blocks most status that "target" applies (not self), unless move explicitly bypasses
     if target.status2.has_substitute():
-        return False
+        return None
     # Safeguard prevents status to target's side
     if _is_safeguarded(battle_state, target_id):
-        return False
-    return True
+        return None
+    return target
 
 
-def apply_sleep(battle_state: BattleState, target_id: int, turns: int) -> None:
-    """Apply sleep with specified turns, respecting Gen 3 immunities.
+def _unsubstituted_target(
+    battle_state: BattleState, target_id: int, blocking_ability: Ability | None = None
+) -> BattlePokemon | None:
+    """Return the target unless it is absent, behind a Substitute, or has blocking_ability.
 
-    Insomnia/Vital Spirit, Uproar block sleep.
+    Shared guard for the non-damaging volatile effects below.
     """
     target = battle_state.battlers[target_id]
     if target is None:
-        return
+        return None
+    # Substitute blocks most non-damaging effects
+    if target.status2.has_substitute():
+        return None
+    if blocking_ability is not None and target.ability == blocking_ability:
+        return None
+    return target
+
+
+def is_uproar_active(battle_state: BattleState) -> bool:
+    """Return True if any battler has Uproar turns remaining.
+
+    Tests the Uproar bits directly; a non-zero field means turns remain.
+    """
+    for b in battle_state.battlers:
+        if b is not None and b.status2 & Status2.UPROAR:
+            return True
+    return False
+
+
+def _apply_sleep(battle_state: BattleState, target: BattlePokemon, turns: int) -> None:
     # Insomnia/Vital Spirit immunity
-    if target.ability in (Ability.INSOMNIA, Ability.VITAL_SPIRIT):
+    ability = target.ability
+    if ability == Ability.INSOMNIA or ability == Ability.VITAL_SPIRIT:
         return
     # Uproar prevents sleep for all battlers while active
-    for b in battle_state.battlers:
-        if b and b.status2.get_uproar_turns() > 0:
-            return
+    if is_uproar_active(battle_state):
+        return
     # Type and other immunities: none for sleep
     # Apply
     target.status1 = target.status1.remove_sleep().set_sleep_turns(turns)
 
 
-def apply_poison(battle_state: BattleState, target_id: int, toxic: bool) -> None:
-    """Apply regular or toxic poison, with Steel/Poison-type and Ability immunities."""
-    target = battle_state.battlers[target_id]
-    if target is None:
-        return
+def _apply_poison(target: BattlePokemon, toxic: bool) -> None:
     # Immunities: Steel-type and Poison-type (Gen 3), Immunity ability, and already poisoned
     if Type.STEEL in target.types or Type.POISON in target.types:
         return
@@ -72,47 +98,81 @@ def apply_poison(battle_state: BattleState, target_id: int, toxic: bool) -> None
         return
     # Apply
     if toxic:
-        target.status1 = target.status1.remove_poison() | Status1.create_toxic(counter=1)
+        target.status1 = target.status1.remove_poison() | _TOXIC
     else:
-        target.status1 = target.status1.remove_poison() | Status1.create_poison()
+        target.status1 = target.status1.remove_poison() | _POISON
 
 
-def apply_burn(battle_state: BattleState, target_id: int) -> None:
-    """Apply burn, blocked by Fire-type and Water Veil (Gen 3)."""
-    target = battle_state.battlers[target_id]
-    if target is None:
-        return
+def _apply_burn(target: BattlePokemon) -> None:
     # Immunities: Fire-type, Water Veil ability
     if Type.FIRE in target.types:
         return
     if target.ability == Ability.WATER_VEIL:
         return
-    target.status1 = target.status1.remove_burn() | Status1.create_burn()
+    target.status1 = target.status1.remove_burn() | _BURN
 
 
-def apply_paralysis(battle_state: BattleState, target_id: int) -> None:
-    """Apply paralysis, blocked by Electric-type and Limber (Gen 3)."""
-    target = battle_state.battlers[target_id]
-    if target is None:
-        return
+def _apply_paralysis(target: BattlePokemon) -> None:
     # Immunities: Electric-type, Limber ability
     if Type.ELECTRIC in target.types:
         return
     if target.ability == Ability.LIMBER:
         return
-    target.status1 = target.status1.remove_paralysis() | Status1.create_paralysis()
+    target.status1 = target.status1.remove_paralysis() | _PARALYSIS
 
 
-def apply_freeze(battle_state: BattleState, target_id: int) -> None:
-    """Apply freeze, blocked by Magma Armor (Gen 3)."""
-    target = battle_state.battlers[target_id]
-    if target is None:
-        return
+def _apply_freeze(target: BattlePokemon) -> None:
     # Immunities: already frozen or type Ice has no immunity; Magma Armor prevents freeze
     if target.ability == Ability.MAGMA_ARMOR:
         return
     # In Gen 3, Hail doesn't prevent freeze; Sun reduces chance (handled at accuracy/roll level, skip for now)
-    target.status1 = target.status1.remove_freeze() | Status1.create_freeze()
+    target.status1 = target.status1.remove_freeze() | _FREEZE
+
+
+def _move_slot(mon: BattlePokemon, move: Move) -> int:
+    """Return the moveset slot holding move, or -1 if the battler doesn't know it (one scan)."""
+    try:
+        return mon.moves.index(move)
+    except ValueError:
+        return -1
+
+
+def apply_sleep(battle_state: BattleState, target_id: int, turns: int) -> None:
+    """Apply sleep with specified turns, respecting Gen 3 immunities.
+
+    Insomnia/Vital Spirit, Uproar block sleep.
+    """
+    target = battle_state.battlers[target_id]
+    if target is not None:
+        _apply_sleep(battle_state, target, turns)
+
+
+def apply_poison(battle_state: BattleState, target_id: int, toxic: bool) -> None:
+    """Apply regular or toxic poison, with Steel/Poison-type and Ability immunities."""
+    target = battle_state.battlers[target_id]
+    if target is not None:
+        _apply_poison(target, toxic)
+
+
+def apply_burn(battle_state: BattleState, target_id: int) -> None:
+    """Apply burn, blocked by Fire-type and Water Veil (Gen 3)."""
+    target = battle_state.battlers[target_id]
+    if target is not None:
+        _apply_burn(target)
+
+
+def apply_paralysis(battle_state: BattleState, target_id: int) -> None:
+    """Apply paralysis, blocked by Electric-type and Limber (Gen 3)."""
+    target = battle_state.battlers[target_id]
+    if target is not None:
+        _apply_paralysis(target)
+
+
+def apply_freeze(battle_state: BattleState, target_id: int) -> None:
+    """Apply freeze, blocked by Magma Armor (Gen 3)."""
+    target = battle_state.battlers[target_id]
+    if target is not None:
+        _apply_freeze(target)
 
 
 def primary_sleep(battle_state: BattleState) -> None:
@@ -120,11 +180,11 @@ def primary_sleep(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectSleep in data/battle_scripts_1.s
     """
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
     # Sleep turns: Emerald uses 2-5 turns typically; as placeholder use 2
-    apply_sleep(battle_state, target_id, turns=2)
+    _apply_sleep(battle_state, target, turns=2)
 
 
 def primary_poison(battle_state: BattleState) -> None:
@@ -132,10 +192,10 @@ def primary_poison(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectPoison
     """
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_poison(battle_state, target_id, toxic=False)
+    _apply_poison(target, toxic=False)
 
 
 def primary_toxic(battle_state: BattleState) -> None:
@@ -143,35 +203,31 @@ def primary_toxic(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectToxic
     """
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_poison(battle_state, target_id, toxic=True)
+    _apply_poison(target, toxic=True)
 
 
-def secondary_poison(battle_state: BattleState) -> None:
-    """Secondary poison on-hit effect.
-
-    Same as primary but assumes script already handled Substitute/Safeguard/Shield Dust.
-    Source: BattleScript_EffectPoisonHit path
-    """
-    primary_poison(battle_state)
+# Secondary poison on-hit effect: same as primary, the script already handled
+# Substitute/Safeguard/Shield Dust (BattleScript_EffectPoisonHit path)
+secondary_poison = primary_poison
 
 
 def secondary_burn(battle_state: BattleState) -> None:
     """Secondary burn on-hit effect."""
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_burn(battle_state, target_id)
+    _apply_burn(target)
 
 
 def secondary_badly_poison(battle_state: BattleState) -> None:
     """Secondary badly poison (Toxic) effect (e.g., Poison Fang)."""
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_poison(battle_state, target_id, toxic=True)
+    _apply_poison(target, toxic=True)
 
 
 def primary_will_o_wisp(battle_state: BattleState) -> None:
@@ -179,10 +235,10 @@ def primary_will_o_wisp(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectWillOWisp
     """
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_burn(battle_state, target_id)
+    _apply_burn(target)
 
 
 def secondary_overheat_user_drop(battle_state: BattleState) -> None:
@@ -201,12 +257,9 @@ def primary_yawn(battle_state: BattleState) -> None:
     respecting Insomnia/Vital Spirit/Uproar at time of sleep in end-turn processor.
     """
     target_id = battle_state.battler_target
-    target = battle_state.battlers[target_id]
+    target = _unsubstituted_target(battle_state, target_id)
     if target is None:
         return
-    # Substitute blocks
-    if target.status2.has_substitute():
-        return
     # Already statused: Yawn still makes drowsy in Gen 3? In Gen 3, Yawn fails if target already has a status.
     if target.status1.has_major_status():
         return
@@ -218,52 +271,40 @@ def primary_yawn(battle_state: BattleState) -> None:
 
 def secondary_paralysis(battle_state: BattleState) -> None:
     """Secondary paralysis on-hit effect."""
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_paralysis(battle_state, target_id)
+    _apply_paralysis(target)
 
 
 def secondary_freeze(battle_state: BattleState) -> None:
     """Secondary freeze on-hit effect."""
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
+    target = _major_status_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
-    apply_freeze(battle_state, target_id)
+    _apply_freeze(target)
 
 
 def secondary_flinch(battle_state: BattleState) -> None:
     """Secondary flinch on-hit effect (Inner Focus blocks)."""
-    target_id = battle_state.battler_target
-    target = battle_state.battlers[target_id]
+    # Substitute blocks flinch only if hit broke sub? For now, if sub exists then block.
+    # Inner Focus prevents flinch.
+    target = _unsubstituted_target(battle_state, battle_state.battler_target, Ability.INNER_FOCUS)
     if target is None:
         return
-    # Substitute blocks flinch only if hit broke sub? For now, if sub exists then block
-    if target.status2.has_substitute():
-        return
-    # Inner Focus prevents flinch
-    if target.ability == Ability.INNER_FOCUS:
-        return
     target.status2 |= Status2.FLINCHED
 
 
-def secondary_paralysis_bounce(battle_state: BattleState) -> None:
-    """Bounce secondary: 30% paralysis on second turn connects."""
-    target_id = battle_state.battler_target
-    if not _can_apply_major_status(battle_state, target_id):
-        return
-    apply_paralysis(battle_state, target_id)
+# Bounce secondary: 30% paralysis on second turn connects
+secondary_paralysis_bounce = secondary_paralysis
 
 
-def secondary_flinch_sky_attack(battle_state: BattleState) -> None:
-    """Sky Attack secondary: flinch chance on hit (Gen 3)."""
-    # Use existing flinch handler
-    secondary_flinch(battle_state)
+# Sky Attack secondary: flinch chance on hit (Gen 3)
+secondary_flinch_sky_attack = secondary_flinch
 
 
-def secondary_flinch_minimize_family(battle_state: BattleState) -> None:
-    """Apply flinch for FLINCH_MINIMIZE_HIT family (Astonish, Extrasensory, Needle Arm)."""
-    secondary_flinch(battle_state)
+# FLINCH_MINIMIZE_HIT family (Astonish, Extrasensory, Needle Arm)
+secondary_flinch_minimize_family = secondary_flinch
 
 
 def secondary_smellingsalt(battle_state: BattleState) -> None:
@@ -286,19 +327,13 @@ def primary_confuse(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectConfuse
     """
-    target_id = battle_state.battler_target
-    target = battle_state.battlers[target_id]
+    # Substitute blocks; Own Tempo prevents confusion
+    target = _unsubstituted_target(battle_state, battle_state.battler_target, Ability.OWN_TEMPO)
     if target is None:
         return
-    # Substitute blocks most non-damaging effects
-    if target.status2.has_substitute():
-        return
-    # Own Tempo prevents confusion
-    if target.ability == Ability.OWN_TEMPO:
-        return
     # Duration 2-5 turns in Gen 3
     r = rng.rand16(battle_state)
-    turns = 2 + (r % 4)  # 2..5
+    turns = 2 + (r & 3)  # 2..5
     target.status2 = target.status2.remove_confusion() | Status2.confusion_turn(turns)
 
 
@@ -307,17 +342,14 @@ def primary_swagger(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectSwagger
     """
-    target_id = battle_state.battler_target
-    target = battle_state.battlers[target_id]
-    if target is None:
-        return
     # Substitute blocks non-damaging effects
-    if target.status2.has_substitute():
+    target = _unsubstituted_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
     # Confuse if possible
     if target.ability != Ability.OWN_TEMPO:
         r = rng.rand16(battle_state)
-        turns = 2 + (r % 4)
+        turns = 2 + (r & 3)
         target.status2 = target.status2.remove_confusion() | Status2.confusion_turn(turns)
     # Raise target's Attack by 2 stages (even if confusion didn't apply)
     stat_changes.change_stage(target, 1, +2)
@@ -328,25 +360,21 @@ def primary_flatter(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectFlatter
     """
-    target_id = battle_state.battler_target
-    target = battle_state.battlers[target_id]
-    if target is None:
-        return
     # Substitute blocks non-damaging effects
-    if target.status2.has_substitute():
+    target = _unsubstituted_target(battle_state, battle_state.battler_target)
+    if target is None:
         return
     # Confuse if possible
     if target.ability != Ability.OWN_TEMPO:
         r = rng.rand16(battle_state)
-        turns = 2 + (r % 4)
+        turns = 2 + (r & 3)
         target.status2 = target.status2.remove_confusion() | Status2.confusion_turn(turns)
     # Raise target's Special Attack by 2 stages regardless
     stat_changes.change_stage(target, 4, +2)
 
 
-def secondary_confuse(battle_state: BattleState) -> None:
-    """Secondary confusion on-hit effect."""
-    primary_confuse(battle_state)
+# Secondary confusion on-hit effect
+secondary_confuse = primary_confuse
 
 
 def primary_attract(battle_state: BattleState) -> None:
@@ -354,17 +382,11 @@ def primary_attract(battle_state: BattleState) -> None:
 
     Source: BattleScript_EffectAttract
     """
-    target_id = battle_state.battler_target
     attacker_id = battle_state.battler_attacker
-    target = battle_state.battlers[target_id]
+    # Substitute blocks; Oblivious prevents attraction
+    target = _unsubstituted_target(battle_state, battle_state.battler_target, Ability.OBLIVIOUS)
     if target is None:
         return
-    # Substitute blocks
-    if target.status2.has_substitute():
-        return
-    # Oblivious prevents attraction
-    if target.ability == Ability.OBLIVIOUS:
-        return
     # Gender checks omitted (schema lacks gender); assume allowed
     target.status2 = target.status2.set_infatuated_with(attacker_id)
 
@@ -378,7 +400,7 @@ def primary_taunt(battle_state: BattleState) -> None:
     ds = battle_state.disable_structs[target_id]
     # Duration 2-5 turns
     r = rng.rand16(battle_state)
-    ds.tauntTimer = 2 + (r % 4)
+    ds.tauntTimer = 2 + (r & 3)
 
 
 def primary_torment(battle_state: BattleState) -> None:
@@ -406,9 +428,7 @@ def primary_disable(battle_state: BattleState) -> None:
     # Prefer to disable target's last used move if present and has PP
     last_move = battle_state.last_moves[target_id]
     move_to_disable = last_move
-    slot = -1
-    if move_to_disable != 0 and move_to_disable in target.moves:
-        slot = target.moves.index(move_to_disable)
+    slot = _move_slot(target, move_to_disable) if move_to_disable != 0 else -1
     # If no last move or NONE, pick a random non-empty move with PP
     if slot < 0:
         candidates = [i for i, mv in enumerate(target.moves) if mv != 0 and target.pp[i] > 0]
@@ -422,7 +442,7 @@ def primary_disable(battle_state: BattleState) -> None:
     # Set Disable 2-5 turns
     r = rng.rand16(battle_state)
     ds_t.disabledMove = move_to_disable
-    ds_t.disableTimer = 2 + (r % 4)
+    ds_t.disableTimer = 2 + (r & 3)
     ds_t.disableTimerStartValue = ds_t.disableTimer
 
 
@@ -440,10 +460,8 @@ def primary_encore(battle_state: BattleState) -> None:
     last_move = battle_state.last_moves[target_id]
     if last_move == 0:
         return
-    if last_move not in target.moves:
-        return
-    pos = target.moves.index(last_move)
-    if target.pp[pos] <= 0:
+    pos = _move_slot(target, last_move)
+    if pos < 0 or target.pp[pos] <= 0:
         return
     # Gen 3 Encore lasts 3-7 turns
     r = rng.rand16(battle_state)
@@ -459,7 +477,7 @@ def primary_defense_curl(battle_state: BattleState) -> None:
     if mon is None:
         return
     # Raise Defense by 1 and set Defense Curl flag
-    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
+    stat_changes.change_stage(mon, stat_changes.STAT_DEF, 1)
     mon.status2 |= Status2.DEFENSE_CURL
 
 
@@ -475,7 +493,7 @@ def primary_minimize(battle_state: BattleState) -> None:
     # Set minimized state
     battle_state.status3_minimized[user] = True
     # Raise evasion one stage
-    stat_changes.raise_stat_user(battle_state, stat_changes.STAT_EVASION, 1)
+    stat_changes.change_stage(mon, stat_changes.STAT_EVASION, 1)
 
 
 def primary_stockpile(battle_state: BattleState) -> None:
@@ -484,9 +502,10 @@ def primary_stockpile(battle_state: BattleState) -> None:
     ds = battle_state.disable_structs[uid]
     if ds.stockpileCounter < 3:
         ds.stockpileCounter += 1
-        ds.stockpileCounter = min(3, ds.stockpileCounter)
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_DEF, 1)
-        stat_changes.raise_stat_user(battle_state, stat_changes.STAT_SPDEF, 1)
+        mon = battle_state.battlers[uid]
+        if mon is not None:
+            stat_changes.change_stage(mon, stat_changes.STAT_DEF, 1)
+            stat_changes.change_stage(mon, stat_changes.STAT_SPDEF, 1)
 
 
 def primary_swallow(battle_state: BattleState) -> None:
@@ -495,18 +514,16 @@ def primary_swallow(battle_state: BattleState) -> None:
     mon = battle_state.battlers[uid]
     if mon is None:
         return
-    cnt = max(0, min(3, battle_state.disable_structs[uid].stockpileCounter))
+    ds = battle_state.disable_structs[uid]
+    cnt = max(0, min(3, ds.stockpileCounter))
     if cnt == 0:
         return
-    if cnt == 1:
-        heal = max(1, mon.maxHP // 4)
-    elif cnt == 2:
-        heal = max(1, mon.maxHP // 2)
-    else:
-        heal = mon.maxHP
-    mon.hp = min(mon.maxHP, mon.hp + heal)
+    # maxHP / (1 << (3 - stockpile)) as in the game: 1/4, 1/2, full
+    max_hp = mon.maxHP
+    heal = max(1, max_hp >> (3 - cnt))
+    mon.hp = min(max_hp, mon.hp + heal)
     # Reset stockpile
-    battle_state.disable_structs[uid].stockpileCounter = 0
+    ds.stockpileCounter = 0
 
 
 def primary_charge(battle_state: BattleState) -> None:
@@ -524,7 +541,7 @@ def primary_uproar(battle_state: BattleState) -> None:
         return
     # 2-5 turns
     r = rng.rand16(battle_state)
-    turns = 2 + (r % 4)
+    turns = 2 + (r & 3)
     mon.status2 = mon.status2.set_uproar_turns(turns)
     # Lock-On timers decrement at end-turn; nothing to do here
 
@@ -535,10 +552,11 @@ def primary_rampage(battle_state: BattleState) -> None:
     if mon is None:
         return
     # If not already locked, start 2-3 turns lock
-    if mon.status2.get_lock_confuse_turns() == 0:
+    status2 = mon.status2
+    if status2.get_lock_confuse_turns() == 0:
         r = rng.rand16(battle_state)
-        turns = 2 + (r % 2)  # 2-3
-        mon.status2 = mon.status2.set_lock_confuse_turns(turns)
+        turns = 2 + (r & 1)  # 2-3
+        mon.status2 = status2.set_lock_confuse_turns(turns)
 
 
 # =====================
@@ -548,15 +566,13 @@ def primary_rampage(battle_state: BattleState) -> None:
 
 def primary_leech_seed(battle_state: BattleState) -> None:
     target_id = battle_state.battler_target
-    target = battle_state.battlers[target_id]
+    # Substitute blocks Leech Seed
+    target = _unsubstituted_target(battle_state, target_id)
     if target is None:
         return
     # Grass-types are immune in Gen 3
     if Type.GRASS in target.types:
         return
-    # Substitute blocks Leech Seed
-    if target.status2.has_substitute():
-        return
     # Mark as seeded by storing attacker id in special_statuses.physicalBattlerId (reuse available field)
     ss = battle_state.special_statuses[target_id]
     ss.physicalBattlerId = battle_state.battler_attacker
@@ -572,9 +588,8 @@ def primary_partial_trap(battle_state: BattleState) -> None:
         return
     # Set wrapped turns 2-5 and mark escape prevention
     r = rng.rand16(battle_state)
-    turns = 2 + (r % 4)
-    target.status2 = target.status2.remove_wrapped() | Status2.wrapped_turn(turns)
-    target.status2 |= Status2.ESCAPE_PREVENTION
+    turns = 2 + (r & 3)
+    target.status2 = target.status2.remove_wrapped() | Status2.wrapped_turn(turns) | Status2.ESCAPE_PREVENTION
 
 
 def primary_ingrain(battle_state: BattleState) -> None:
@@ -621,11 +636,11 @@ def primary_spite(battle_state: BattleState) -> None:
     if last == 0:
         return
     # Find slot
-    if last in target.moves:
-        pos = target.moves.index(last)
+    pos = _move_slot(target, last)
+    if pos >= 0:
         # Roll 2-5 using the LCG
         r16 = rng.rand16(battle_state)
-        reduction = 2 + (r16 % 4)
+        reduction = 2 + (r16 & 3)
         target.pp[pos] = max(0, target.pp[pos] - reduction)
 
 
@@ -724,7 +739,7 @@ def primary_water_sport(battle_state: BattleState) -> None:
 def primary_heal_bell(battle_state: BattleState) -> None:
     """Heal Bell/Aromatherapy: cures party statuses; Soundproof blocks Heal Bell only."""
     user_id = battle_state.battler_attacker
-    user_is_player = (user_id % 2) == 0
+    user_is_player = (user_id & 1) == 0
     party = battle_state.player_party if user_is_player else battle_state.opponent_party
     is_aromatherapy = battle_state.current_move == Move.AROMATHERAPY
     for mon in party:
@@ -745,17 +760,18 @@ def primary_teeter_dance(battle_state: BattleState) -> None:
         if mon is None or i == user:
             continue
         # Singles: target opponents only; Doubles: also partner
-        is_opponent = (i % 2) != (user % 2)
+        is_opponent = (i & 1) != (user & 1)
         is_partner = i == (user ^ 2)
         if is_opponent or is_partner:
+            status2 = mon.status2
             # Substitute blocks non-damaging confusion
-            if mon.status2.has_substitute():
+            if status2.has_substitute():
                 continue
             if mon.ability == Ability.OWN_TEMPO:
                 continue
             r = rng.rand16(battle_state)
-            turns = 2 + (r % 4)
-            mon.status2 = mon.status2.remove_confusion() | Status2.confusion_turn(turns)
+            turns = 2 + (r & 3)
+            mon.status2 = status2.remove_confusion() | Status2.confusion_turn(turns)
 
 
 def primary_present(battle_state: BattleState) -> None:
@@ -777,7 +793,7 @@ def primary_present(battle_state: BattleState) -> None:
         if attacker is None:
             return
         move_type = get_move_type(battle_state.current_move)
-        base = calc.calculate_base_damage(attacker, target, battle_state.current_move, battle_state.side_statuses[battle_state.battler_target % 2], power_override=40, type_override=move_type, attacker_id=battle_state.battler_attacker, defender_id=battle_state.battler_target, critical_multiplier=battle_state.critical_multiplier, weather=battle_state.weather)
+        base = calc.calculate_base_damage(attacker, target, battle_state.current_move, battle_state.side_statuses[battle_state.battler_target & 1], power_override=40, type_override=move_type, attacker_id=battle_state.battler_attacker, defender_id=battle_state.battler_target, critical_multiplier=battle_state.critical_multiplier, weather=battle_state.weather)
         battle_state.battle_move_damage = base
         target.hp = max(0, target.hp - base)
     elif rand < 178:
@@ -786,7 +802,7 @@ def primary_present(battle_state: BattleState) -> None:
         if attacker is None:
             return
         move_type = get_move_type(battle_state.current_move)
-        base = calc.calculate_base_damage(attacker, target, battle_state.current_move, battle_state.side_statuses[battle_state.battler_target % 2], power_override=80, type_override=move_type, attacker_id=battle_state.battler_attacker, defender_id=battle_state.battler_target, critical_multiplier=battle_state.critical_multiplier, weather=battle_state.weather)
+        base = calc.calculate_base_damage(attacker, target, battle_state.current_move, battle_state.side_statuses[battle_state.battler_target & 1], power_override=80, type_override=move_type, attacker_id=battle_state.battler_attacker, defender_id=battle_state.battler_target, critical_multiplier=battle_state.critical_multiplier, weather=battle_state.weather)
         battle_state.battle_move_damage = base
         target.hp = max(0, target.hp - base)
     elif rand < 204:
@@ -795,7 +811,7 @@ def primary_present(battle_state: BattleState) -> None:
         if attacker is None:
             return
         move_type = get_move_type(battle_state.current_move)
-        base = calc.calculate_base_damage(attacker, target, battle_state.current_move, battle_state.side_statuses[battle_state.battler_target % 2], power_override=120, type_override=move_type, attacker_id=battle_state.battler_attacker, defender_id=battle_state.battler_target, critical_multiplier=battle_state.critical_multiplier, weather=battle_state.weather)
+        base = calc.calculate_base_damage(attacker, target, battle_state.current_move, battle_state.side_statuses[battle_state.battler_target & 1], power_override=120, type_override=move_type, attacker_id=battle_state.battler_attacker, defender_id=battle_state.battler_target, critical_multiplier=battle_state.critical_multiplier, weather=battle_state.weather)
         battle_state.battle_move_damage = base
         target.hp = max(0, target.hp - base)
     else:
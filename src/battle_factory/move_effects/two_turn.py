@@ -151,7 +151,7 @@ def resolve_two_turn_damage(battle_state: BattleState) -> None:
 
     # Random roll 85-100%
     rand16 = rng.rand16(battle_state)
-    roll = 85 + (rand16 % 16)
+    roll = 85 + (rand16 & 15)
     dmg = (dmg * roll) // 100
 
     if dmg < 1:
@@ -367,6 +367,31 @@ TYPE_EFFECTIVENESS_CHART = [
 ]
 
 
+def _scan_chart(attacking_type: Type, defending_type: Type, has_foresight: bool) -> int:
+    """Walk TYPE_EFFECTIVENESS_CHART the way the C code does; used to build the lookup tables."""
+    i = 0
+    while i < len(TYPE_EFFECTIVENESS_CHART) and TYPE_EFFECTIVENESS_CHART[i] != TYPE_ENDTABLE:
+        atk_type = TYPE_EFFECTIVENESS_CHART[i]
+        def_type = TYPE_EFFECTIVENESS_CHART[i + 1]
+        multiplier = TYPE_EFFECTIVENESS_CHART[i + 2]
+
+        # Handle Foresight special case - from battle_script_commands.c lines 1388-1394
+        if atk_type == TYPE_FORESIGHT:
+            if has_foresight:
+                break  # Foresight removes Ghost immunities
+            i += 3
+            continue
+
+        # Check for matching type combination
+        if atk_type == attacking_type and def_type == defending_type:
+            return multiplier
+
+        i += 3
+
+    # No entry found = normal effectiveness (×1.0)
+    return TYPE_MUL_NORMAL
+
+
 class TypeEffectiveness:
     """
     Type effectiveness calculator - from pokeemerald/src/battle_script_commands.c
@@ -390,27 +415,13 @@ class TypeEffectiveness:
             TYPE_MUL_NOT_EFFECTIVE (5) for not very effective (×0.5)
             TYPE_MUL_NORMAL (10) for normal effectiveness (×1.0)
             TYPE_MUL_SUPER_EFFECTIVE (20) for super effective (×2.0)
-        """
-        i = 0
-        while i < len(TYPE_EFFECTIVENESS_CHART) and TYPE_EFFECTIVENESS_CHART[i] != TYPE_ENDTABLE:
-            atk_type = TYPE_EFFECTIVENESS_CHART[i]
-            def_type = TYPE_EFFECTIVENESS_CHART[i + 1]
-            multiplier = TYPE_EFFECTIVENESS_CHART[i + 2]
 
-            # Handle Foresight special case - from battle_script_commands.c lines 1388-1394
-            if atk_type == TYPE_FORESIGHT:
-                if has_foresight:
-                    break  # Foresight removes Ghost immunities
-                i += 3
-                continue
-
-            # Check for matching type combination
-            if atk_type == attacking_type and def_type == defending_type:
-                return multiplier
-
-            i += 3
-
-        # No entry found = normal effectiveness (×1.0)
+        Type values outside the chart (including negative ones) get TYPE_MUL_NORMAL,
+        as they did when the chart was scanned per call.
+        """
+        if 0 <= attacking_type < _NUM_TYPES and 0 <= defending_type < _NUM_TYPES:
+            table = _FORESIGHT_TYPE_EFFECTIVENESS_TABLE if has_foresight else TYPE_EFFECTIVENESS_TABLE
+            return table[attacking_type][defending_type]
         return TYPE_MUL_NORMAL
 
     @staticmethod
@@ -492,3 +503,15 @@ class TypeEffectiveness:
             return MSG_SUPER_EFFECTIVE
         else:
             return ""  # Normal effectiveness - no message
+
+
+# Precomputed gTypeEffectiveness lookups: TABLE[attacking][defending], without and with Foresight.
+# Lets get_effectiveness and hot damage loops index directly instead of scanning TYPE_EFFECTIVENESS_CHART per call.
+TYPE_EFFECTIVENESS_TABLE: tuple[tuple[int, ...], ...] = tuple(
+    tuple(_scan_chart(attacking_type, defending_type, False) for defending_type in Type) for attacking_type in Type
+)
+_FORESIGHT_TYPE_EFFECTIVENESS_TABLE: tuple[tuple[int, ...], ...] = tuple(
+    tuple(_scan_chart(attacking_type, defending_type, True) for defending_type in Type) for attacking_type in Type
+)
+# Table bound; Type values are contiguous from 0
+_NUM_TYPES = len(TYPE_EFFECTIVENESS_TABLE)
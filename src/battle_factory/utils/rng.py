@@ -1,19 +1,22 @@
 from src.battle_factory.schema.battle_state import BattleState
 
+# LCG parameters; callers that advance the seed in a local (hot loops) must use these
+LCG_MULTIPLIER = 1664525
+LCG_INCREMENT = 1013904223
+
 
 def advance(battle_state: BattleState) -> int:
     """Advance the LCG RNG and return the new 32-bit seed.
 
     Mirrors Emerald's RNG: seed = (seed * 1664525 + 1013904223) mod 2^32
     """
-    battle_state.rng_seed = (battle_state.rng_seed * 1664525 + 1013904223) & 0xFFFFFFFF
+    battle_state.rng_seed = (battle_state.rng_seed * LCG_MULTIPLIER + LCG_INCREMENT) & 0xFFFFFFFF
     return battle_state.rng_seed
 
 
 def rand16(battle_state: BattleState) -> int:
     """Advance RNG and return upper 16 bits (0..65535)."""
-    advance(battle_state)
-    return (battle_state.rng_seed >> 16) & 0xFFFF
+    return advance(battle_state) >> 16
 
 
 def choice_index(battle_state: BattleState, count: int) -> int:
@@ -23,4 +26,7 @@ def choice_index(battle_state: BattleState, count: int) -> int:
     """
     if count <= 0:
         return -1
-    return rand16(battle_state) % count
+    # Single advance in a local; the seed is already masked to 32 bits so >> 16 is 0..65535
+    seed = (battle_state.rng_seed * LCG_MULTIPLIER + LCG_INCREMENT) & 0xFFFFFFFF
+    battle_state.rng_seed = seed
+    return (seed >> 16) % count
@@ -0,0 +1,87 @@
+from src.battle_factory.battle_engine import BattleEngine, UserBattleAction
+from src.battle_factory.enums import Move, Species, Item
+from src.battle_factory.move_effects import reaction_moves
+from src.battle_factory.utils.mon_factory import create_battle_pokemon
+
+
+def make_mon_with_moves(move: Move, move2: Move = Move.NONE):
+    return create_battle_pokemon(Species.RATTATA, level=50, moves=(move, move2, Move.NONE, Move.NONE), ability_slot=0, item=Item.NONE)
+
+
+def use_moves(eng: BattleEngine, player_slot: int, opponent_slot: int) -> None:
+    eng.process_turn(
+        [
+            UserBattleAction(action_type=UserBattleAction.ActionType.USE_MOVE, battler_id=0, move_slot=player_slot),
+            UserBattleAction(action_type=UserBattleAction.ActionType.USE_MOVE, battler_id=1, move_slot=opponent_slot),
+        ]
+    )
+
+
+def test_bide_stores_damage_then_releases_double():
+    eng = BattleEngine()
+    user = make_mon_with_moves(Move.BIDE)
+    foe = make_mon_with_moves(Move.TACKLE)
+    eng.initialize_battle(user, foe, seed=1)
+    state = eng.battle_state
+    ds = state.disable_structs[0]
+
+    # Setup turn: Bide starts a 2-turn timer, which end of turn counts down
+    use_moves(eng, 0, 0)
+    assert ds.bideTimerStartValue == 2
+    assert ds.bideTimer == 1
+
+    # Storing turn
+    use_moves(eng, 0, 0)
+    assert ds.bideTimer == 0
+    stored = state.bide_damage[0]
+    assert stored > 0
+    assert state.bide_target[0] == 1
+
+    # Release turn: foe takes twice the stored damage
+    foe_hp = foe.hp
+    use_moves(eng, 0, 0)
+    assert foe.hp == max(0, foe_hp - 2 * stored)
+    assert ds.bideTimerStartValue == 0
+    assert state.bide_damage[0] == 0
+
+
+def test_bide_without_release_does_not_carry_over():
+    eng = BattleEngine()
+    user = make_mon_with_moves(Move.BIDE, Move.SPLASH)
+    foe = make_mon_with_moves(Move.SPLASH)
+    eng.initialize_battle(user, foe, seed=1)
+    ds = eng.battle_state.disable_structs[0]
+
+    use_moves(eng, 0, 0)
+    use_moves(eng, 0, 0)
+    # Skip the release turn
+    use_moves(eng, 1, 0)
+    assert ds.bideTimerStartValue == 0
+
+    # The next Bide starts over rather than releasing immediately
+    use_moves(eng, 0, 0)
+    assert ds.bideTimerStartValue == 2
+    assert ds.bideTimer == 1
+
+
+def test_bide_release_with_nothing_stored_fails():
+    eng = BattleEngine()
+    user = make_mon_with_moves(Move.BIDE)
+    foe = make_mon_with_moves(Move.TACKLE)
+    eng.initialize_battle(user, foe, seed=1)
+    state = eng.battle_state
+    ds = state.disable_structs[0]
+
+    # Setup, then reach the release turn as if no hit had landed while Biding
+    use_moves(eng, 0, 0)
+    ds.bideTimer = 0
+    state.bide_damage[0] = 0
+    state.bide_target[0] = 0
+
+    user_hp, foe_hp = user.hp, foe.hp
+    state.battler_attacker = 0
+    state.battler_target = 1
+    reaction_moves.primary_bide(state)
+    assert user.hp == user_hp
+    assert foe.hp == foe_hp
+    assert ds.bideTimerStartValue == 0
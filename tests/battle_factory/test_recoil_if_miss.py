@@ -0,0 +1,30 @@
+from src.battle_factory.battle_engine import BattleEngine
+from src.battle_factory.constants import MOVE_RESULT_MISSED
+from src.battle_factory.enums import Move, Species, Item
+from src.battle_factory.move_effects import effect_applier
+from src.battle_factory.utils.mon_factory import create_battle_pokemon
+
+
+def make_mon_with_move(move: Move):
+    return create_battle_pokemon(Species.RATTATA, level=50, moves=(move, Move.NONE, Move.NONE, Move.NONE), ability_slot=0, item=Item.NONE)
+
+
+def test_crash_damage_ignores_negative_script_damage():
+    eng = BattleEngine()
+    user = make_mon_with_move(Move.JUMP_KICK)
+    foe = make_mon_with_move(Move.SPLASH)
+    eng.initialize_battle(user, foe, seed=1)
+
+    state = eng.battle_state
+    state.battler_attacker = 0
+    state.battler_target = 1
+    state.current_move = Move.JUMP_KICK
+    # A heal earlier in the turn leaves script_damage negative; the miss crash must still hurt
+    state.script_damage = -60
+    state.move_result_flags |= MOVE_RESULT_MISSED
+    hp_before = user.hp
+
+    effect_applier.apply_secondary(state)
+
+    assert user.hp <= user.maxHP
+    assert user.hp == hp_before - 1
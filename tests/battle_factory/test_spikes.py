@@ -0,0 +1,50 @@
+from src.battle_factory.battle_engine import BattleEngine, UserBattleAction
+from src.battle_factory.enums import Move, Species, Item
+from src.battle_factory.move_effects.field_effects import SIDE_STATUS_SPIKES
+from src.battle_factory.utils.mon_factory import create_battle_pokemon
+
+
+def make_mon_with_moves(move: Move, move2: Move = Move.NONE):
+    return create_battle_pokemon(Species.RATTATA, level=50, moves=(move, move2, Move.NONE, Move.NONE), ability_slot=0, item=Item.NONE)
+
+
+def use_moves(eng: BattleEngine, player_slot: int, opponent_slot: int) -> None:
+    eng.process_turn(
+        [
+            UserBattleAction(action_type=UserBattleAction.ActionType.USE_MOVE, battler_id=0, move_slot=player_slot),
+            UserBattleAction(action_type=UserBattleAction.ActionType.USE_MOVE, battler_id=1, move_slot=opponent_slot),
+        ]
+    )
+
+
+def test_spikes_stack_to_three_layers_with_side_bit_set():
+    eng = BattleEngine()
+    user = make_mon_with_moves(Move.SPIKES)
+    foe = make_mon_with_moves(Move.SPLASH)
+    eng.initialize_battle(user, foe, seed=1)
+
+    for expected_layers in (1, 2, 3):
+        use_moves(eng, 0, 0)
+        assert eng.battle_state.spikes_layers[1] == expected_layers
+        assert eng.battle_state.side_statuses[1] & SIDE_STATUS_SPIKES
+
+    # A fourth use fails at the 3-layer cap
+    use_moves(eng, 0, 0)
+    assert eng.battle_state.spikes_layers[1] == 3
+    assert eng.battle_state.side_statuses[1] & SIDE_STATUS_SPIKES
+
+
+def test_rapid_spin_clears_spikes_layers_and_side_bit():
+    eng = BattleEngine()
+    user = make_mon_with_moves(Move.SPIKES, Move.SPLASH)
+    foe = make_mon_with_moves(Move.SPLASH, Move.RAPID_SPIN)
+    eng.initialize_battle(user, foe, seed=1)
+
+    for _ in range(3):
+        use_moves(eng, 0, 0)
+    assert eng.battle_state.spikes_layers[1] == 3
+
+    # Foe spins away its side's Spikes while the user stays idle
+    use_moves(eng, 1, 1)
+    assert eng.battle_state.spikes_layers[1] == 0
+    assert not eng.battle_state.side_statuses[1] & SIDE_STATUS_SPIKES
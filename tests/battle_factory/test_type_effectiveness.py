@@ -0,0 +1,19 @@
+from src.battle_factory.constants import TYPE_MUL_NO_EFFECT, TYPE_MUL_NORMAL, TYPE_MUL_SUPER_EFFECTIVE
+from src.battle_factory.enums import Type
+from src.battle_factory.type_effectiveness import TypeEffectiveness
+
+
+def test_chart_pairs_match_gen3():
+    assert TypeEffectiveness.get_effectiveness(Type.WATER, Type.FIRE) == TYPE_MUL_SUPER_EFFECTIVE
+    assert TypeEffectiveness.get_effectiveness(Type.NORMAL, Type.GHOST) == TYPE_MUL_NO_EFFECT
+    # Foresight removes Ghost's Normal/Fighting immunity
+    assert TypeEffectiveness.get_effectiveness(Type.NORMAL, Type.GHOST, has_foresight=True) == TYPE_MUL_NORMAL
+
+
+def test_types_outside_chart_are_neutral():
+    last = len(Type)
+    assert TypeEffectiveness.get_effectiveness(last, Type.FIRE) == TYPE_MUL_NORMAL
+    assert TypeEffectiveness.get_effectiveness(Type.WATER, last) == TYPE_MUL_NORMAL
+    # Negative values must not wrap around to Dark at the end of the table
+    assert TypeEffectiveness.get_effectiveness(-1, Type.PSYCHIC) == TYPE_MUL_NORMAL
+    assert TypeEffectiveness.get_effectiveness(Type.FIGHTING, -1, has_foresight=True) == TYPE_MUL_NORMAL